@@ -0,0 +1,121 @@
+# streaming ingestion of raw memory-address traces : addresses -> page numbers
+#
+# one access per line , `[TAG] ADDRESS[,SIZE]` with a hex address (0x optional) , anything
+# before the tag is ignored , so these all parse :
+#   7ffd1234                      bare address
+#   R 0x7ffd1234                  tagged read / write / instruction fetch (R , W , I)
+#   I  0401a50,3                  Valgrind lackey (I , L , S , M)
+#   0x401234: W 0x7ffd1234        Pin pinatrace
+#   2 401a50                      Dinero (0 read , 1 write , 2 instruction fetch)
+# blank lines and lines starting with '#' or '==' (tool banners) are skipped
+
+from typing import Iterator,Optional
+from trace_format import write_binary_trace
+
+DEFAULT_PAGE_SIZE=4096
+INSTRUCTION_TAGS=frozenset(('I' , '2'))
+
+class AddressTraceStats :
+    # what ingestion did with the input , filled in while the trace is consumed
+    def __init__(self) :
+        self.lines=0
+        self.references=0
+        self.skipped_lines=0
+        self.instructions_dropped=0
+        self.repeats_collapsed=0
+
+    def to_dict(self) :
+        return dict(vars(self))
+
+def page_shift(page_size : int) -> Optional[int] :
+    # log2(page_size) for powers of two , None otherwise
+    if page_size <= 0 :
+        raise ValueError(f"Page size must be a positive integer : {page_size}")
+    return page_size.bit_length() - 1 if page_size & (page_size - 1) == 0 else None
+
+def iter_address_trace(filename : str , page_size : int = DEFAULT_PAGE_SIZE , drop_instructions : bool = False , collapse_repeats : bool = False , stats : AddressTraceStats = None , chunk_size : int = 1 << 20) -> Iterator[int] :
+    # page numbers of the accesses in an address trace , streamed in chunks of lines
+    shift=page_shift(page_size)
+    if stats is None :
+        stats=AddressTraceStats()
+    last_page=None
+    line_number=0
+
+    with open(filename , 'r') as f :
+        while True :
+            lines=f.readlines(chunk_size)
+            if not lines :
+                break
+            pages=[]
+            append=pages.append
+            for line in lines :
+                line_number += 1
+                tokens=line.split()
+                if not tokens or tokens[0][0] in '#=' :
+                    stats.skipped_lines += 1
+                    continue
+                if drop_instructions and len(tokens) > 1 and tokens[-2] in INSTRUCTION_TAGS :
+                    stats.instructions_dropped += 1
+                    continue
+                address=tokens[-1]
+                if ',' in address :
+                    address=address[:address.index(',')]
+                try :
+                    address=int(address , 16)
+                except ValueError :
+                    raise ValueError(f"{filename}:{line_number} : not an address trace line : {line.strip()!r}") from None
+                page=address >> shift if shift is not None else address // page_size
+                if collapse_repeats :
+                    if page == last_page :
+                        stats.repeats_collapsed += 1
+                        continue
+                    last_page=page
+                append(page)
+
+            stats.lines=line_number
+            stats.references += len(pages)
+            yield from pages
+
+def convert_address_trace(filename : str , binary_filename : str , page_size : int = DEFAULT_PAGE_SIZE , drop_instructions : bool = False , collapse_repeats : bool = False , width : int = 8) -> AddressTraceStats :
+    # address trace -> binary page-number trace (see trace_format.py) in one streaming pass
+    stats=AddressTraceStats()
+    write_binary_trace(iter_address_trace(filename , page_size , drop_instructions , collapse_repeats , stats) , binary_filename , width)
+    return stats
+
+def main() -> None :
+    import argparse
+    import json
+    from registry import ALGORITHMS
+
+    parser=argparse.ArgumentParser(description="Map an address trace to page numbers and simulate it or save it as a binary trace")
+    parser.add_argument('trace' , help="address trace ([TAG] ADDRESS per line)")
+    parser.add_argument('--page-size' , type=int , default=DEFAULT_PAGE_SIZE , help="bytes per page (default 4096)")
+    parser.add_argument('--drop-instructions' , action='store_true' , help="ignore instruction fetches (I / 2 tags)")
+    parser.add_argument('--collapse-repeats' , action='store_true' , help="drop accesses to the same page as the previous one")
+    parser.add_argument('--output' , help="write the page numbers to this binary trace file")
+    parser.add_argument('--algorithms' , nargs='+' , choices=list(ALGORITHMS) , help="simulate these algorithms on the page numbers")
+    parser.add_argument('--frames' , type=int , help="frame count for --algorithms")
+    args=parser.parse_args()
+
+    if args.output :
+        stats=convert_address_trace(args.trace , args.output , args.page_size , args.drop_instructions , args.collapse_repeats)
+        report={'ingestion' : stats.to_dict()}
+    else :
+        stats=AddressTraceStats()
+        pages=iter_address_trace(args.trace , args.page_size , args.drop_instructions , args.collapse_repeats , stats)
+        report={}
+        if args.algorithms :
+            if args.frames is None :
+                parser.error("--algorithms needs --frames")
+            from fused import simulate_all
+            report['page_faults']=simulate_all(args.algorithms , pages , args.frames)
+        else :
+            for _ in pages :
+                pass
+        report['ingestion']=stats.to_dict()
+    print(json.dumps(report , indent=2))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
@@ -0,0 +1,222 @@
+# approximate simulation of huge traces by spatial (SHARDS-style) sampling
+#
+# a page is kept when a hash of its number falls below rate * 2^64 , so every reference to a
+# sampled page is kept and the sample behaves like a smaller trace with the same locality.
+# simulating it with frames * rate frames estimates the full trace's fault ratio.
+# the hash space is split into `replicates` disjoint samples of the same rate ; their spread
+# gives the error bound. the filtering pass reads the trace in blocks and builds the samples of
+# every rate at once , so work after it , and memory , scale with the sample
+
+import random
+from itertools import islice
+from typing import Callable,Dict,Iterable,Iterator,List,NamedTuple,Optional,Sequence,Tuple
+from preprocess import get_numpy
+from registry import create_algorithm,get_algorithm
+
+HASH_MASK=(1 << 64) - 1
+DEFAULT_RATE=0.01
+DEFAULT_REPLICATES=4
+# smaller scaled frame counts make the estimate noisy , the rate is raised to reach this
+MIN_SCALED_FRAMES=32
+# references hashed at a time , bounds the filtering pass's temporary memory
+BLOCK_SIZE=1 << 20
+# two-sided 95% Student t quantiles by degrees of freedom (1.96 beyond the table)
+T_QUANTILES={1 : 12.706 , 2 : 4.303 , 3 : 3.182 , 4 : 2.776 , 5 : 2.571 , 6 : 2.447 , 7 : 2.365 , 8 : 2.306 , 9 : 2.262 , 10 : 2.228}
+
+class ApproximateResult(NamedTuple) :
+    algorithm : str
+    frames : int
+    rate : float              # fraction of pages in each replicate (1.0 = exact simulation)
+    scaled_frames : int
+    replicates : int
+    references : int          # length of the full trace
+    sampled_references : int  # references simulated , over all replicates
+    fault_ratio : float       # estimate : mean over replicates
+    error_bound : Optional[float]  # half-width of the 95% interval (None with one replicate)
+    estimated_page_faults : int
+
+class SampledTrace(NamedTuple) :
+    references : int
+    samples : List[List[int]]
+
+def hash_key(seed : int) -> Tuple[int , int] :
+    # (odd multiplier , offset) of the sampling hash for `seed`
+    rng=random.Random(seed)
+    return rng.getrandbits(64) | 1 , rng.getrandbits(64)
+
+def iter_blocks(reference_string : Iterable[int] , block_size : int = BLOCK_SIZE) -> Iterator[Sequence[int]] :
+    # consecutive slices of a sequence (views of a memory-mapped trace) , or lists from a stream
+    if hasattr(reference_string , '__len__') and hasattr(reference_string , '__getitem__') :
+        for start in range(0 , len(reference_string) , block_size) :
+            yield reference_string[start:start + block_size]
+        return
+    iterator=iter(reference_string)
+    while True :
+        block=list(islice(iterator , block_size))
+        if not block :
+            return
+        yield block
+
+def sample_traces(reference_string : Iterable[int] , rates : Iterable[float] , replicates : int = DEFAULT_REPLICATES , seed : int = 0 , consumers : List[Callable[[Sequence[int]] , object]] = () , block_size : int = BLOCK_SIZE) -> Dict[float , SampledTrace] :
+    # one pass : for every rate , split the pages hashing below replicates * rate * 2^64 into
+    # `replicates` samples. every block read is also handed to `consumers` (e.g. feed_many of
+    # exact engines on a stream)
+    levels=[]
+    for rate in sorted(set(rates)) :
+        if not 0 < rate * replicates <= 1 :
+            raise ValueError(f"rate x replicates must be in (0 , 1] : {rate} x {replicates}")
+        threshold=max(1 , int(rate * (1 << 64)))
+        levels.append((rate , threshold , threshold * replicates , [[] for _ in range(replicates)]))
+    top=max((limit for _ , _ , limit , _ in levels) , default=0)
+    multiplier , offset=hash_key(seed)
+    np=get_numpy()
+    references=0
+
+    for block in iter_blocks(reference_string , block_size) :
+        references += len(block)
+        for consume in consumers :
+            consume(block)
+        pages=None
+        if np is not None :
+            try :
+                pages=np.asarray(block)
+            except (TypeError , ValueError) :
+                pages=None
+            if pages is not None and (pages.ndim != 1 or pages.dtype.kind not in 'iu') :
+                pages=None
+        if pages is not None :
+            # uint64 arithmetic wraps , which is the same as masking to 64 bits
+            hashes=pages.astype(np.uint64) * np.uint64(multiplier) + np.uint64(offset)
+            kept=hashes < np.uint64(top)
+            pages , hashes=pages[kept] , hashes[kept]
+            for _ , threshold , limit , samples in levels :
+                selected=hashes < np.uint64(limit)
+                buckets=hashes[selected] // np.uint64(threshold)
+                level_pages=pages[selected]
+                for replicate in range(replicates) :
+                    samples[replicate].extend(level_pages[buckets == replicate].tolist())
+            continue
+        for page in block :
+            hashed=(page * multiplier + offset) & HASH_MASK
+            if hashed < top :
+                for _ , threshold , limit , samples in levels :
+                    if hashed < limit :
+                        samples[hashed // threshold].append(page)
+    return {rate : SampledTrace(references , samples) for rate , _ , _ , samples in levels}
+
+def sample_trace(reference_string : Iterable[int] , rate : float , replicates : int = DEFAULT_REPLICATES , seed : int = 0) -> SampledTrace :
+    # one pass : split the pages hashing below replicates * rate * 2^64 into `replicates` samples
+    return sample_traces(reference_string , [rate] , replicates , seed)[rate]
+
+def scaled_rate(frames : int , rate : float , replicates : int , min_scaled_frames : int = MIN_SCALED_FRAMES) -> Tuple[float , int] :
+    # (rate , scaled frames) actually used : frames * rate rounded , at least min_scaled_frames ,
+    # with the rate adjusted to match the rounding exactly (rate 1.0 when sampling cannot help)
+    scaled_frames=max(min_scaled_frames , round(frames * rate) , 1)
+    if scaled_frames * replicates >= frames :
+        return 1.0 , frames
+    return scaled_frames / frames , scaled_frames
+
+def estimate(key : str , sampled : SampledTrace , frames : int , rate : float , scaled_frames : int) -> ApproximateResult :
+    # fault ratio of `key` from the replicates in `sampled` , taken at `rate`
+    ratios=[]
+    sampled_references=0
+    # faults are divided by the expected sample size rather than the actual one (SHARDS-adj) :
+    # a sample that missed or over-caught a few hot pages differs mostly by hits , not faults
+    expected_references=rate * sampled.references
+    for sample in sampled.samples :
+        page_faults=create_algorithm(key , scaled_frames).simulate(sample)
+        ratios.append(min(1.0 , page_faults / expected_references) if expected_references else 0.0)
+        sampled_references += len(sample)
+
+    replicates=len(ratios)
+    fault_ratio=sum(ratios) / replicates if replicates else 0.0
+    error_bound=None
+    if rate == 1.0 :
+        error_bound=0.0
+    elif replicates > 1 :
+        variance=sum((ratio - fault_ratio) ** 2 for ratio in ratios) / (replicates - 1)
+        error_bound=T_QUANTILES.get(replicates - 1 , 1.96) * (variance / replicates) ** 0.5
+    return ApproximateResult(key , frames , rate , scaled_frames , replicates , sampled.references , sampled_references ,
+                             fault_ratio , error_bound , round(fault_ratio * sampled.references))
+
+def approximate_simulate(key : str , reference_string : Iterable[int] , frames : int , rate : float = DEFAULT_RATE , replicates : int = DEFAULT_REPLICATES , seed : int = 0 , min_scaled_frames : int = MIN_SCALED_FRAMES) -> ApproximateResult :
+    # estimated fault ratio of `key` with `frames` frames
+    return approximate_sweep([key] , reference_string , [frames] , rate , replicates , seed , min_scaled_frames)[0]
+
+def approximate_sweep(algorithms : List[str] , reference_string : Iterable[int] , frame_counts : List[int] , rate : float = DEFAULT_RATE , replicates : int = DEFAULT_REPLICATES , seed : int = 0 , min_scaled_frames : int = MIN_SCALED_FRAMES) -> List[ApproximateResult] :
+    # every algorithm x frame count from one pass over the trace : frame counts that end up at
+    # the same rate share one sample , and those too small to sample are simulated exactly
+    for frames in frame_counts :
+        if frames <= 0 :
+            raise ValueError(f"Number of frames must be a positive integer : {frames}")
+    plans=[(frames , *scaled_rate(frames , rate , replicates , min_scaled_frames)) for frames in frame_counts]
+    exact=[(key , frames) for key in algorithms for frames , plan_rate , _ in plans if plan_rate == 1.0]
+    streamed=not (hasattr(reference_string , '__len__') and hasattr(reference_string , '__getitem__'))
+    if streamed and any(get_algorithm(key).cls.needs_next_use for key , _ in exact) :
+        # exact Optimal needs the whole trace
+        reference_string=list(reference_string)
+        streamed=False
+
+    engines={(key , frames) : create_algorithm(key , frames) for key , frames in exact}
+    consumers=[]
+    for engine in engines.values() :
+        engine.reset()
+        if streamed :
+            # fed by the sampling pass , so the stream is read once
+            consumers.append(engine.feed_many)
+        else :
+            engine.simulate(reference_string)
+    sampled_rates=[plan_rate for _ , plan_rate , _ in plans if plan_rate != 1.0]
+    samples=sample_traces(reference_string , sampled_rates , replicates , seed , consumers) if sampled_rates or consumers else {}
+
+    results=[]
+    for key in algorithms :
+        for frames , plan_rate , scaled_frames in plans :
+            if plan_rate == 1.0 :
+                engine=engines[(key , frames)]
+                references=engine.references
+                fault_ratio=engine.page_faults / references if references else 0.0
+                results.append(ApproximateResult(key , frames , 1.0 , frames , 1 , references , references ,
+                                                 fault_ratio , 0.0 , engine.page_faults))
+            else :
+                results.append(estimate(key , samples[plan_rate] , frames , plan_rate , scaled_frames))
+    return results
+
+def main() -> None :
+    import argparse
+    import json
+    from registry import ALGORITHMS
+    from trace_format import is_binary_trace,load_trace
+    from utils import iter_reference_file
+
+    parser=argparse.ArgumentParser(description="Estimate fault ratios of huge traces from a hash-sampled subset of pages")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithms' , nargs='+' , default=['lru'] , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , nargs='+' , type=int , required=True)
+    parser.add_argument('--rate' , type=float , default=DEFAULT_RATE , help="fraction of pages per replicate")
+    parser.add_argument('--replicates' , type=int , default=DEFAULT_REPLICATES , help="disjoint samples (error bound needs 2 or more)")
+    parser.add_argument('--min-scaled-frames' , type=int , default=MIN_SCALED_FRAMES)
+    parser.add_argument('--seed' , type=int , default=0)
+    parser.add_argument('--exact' , action='store_true' , help="also run the exact simulation and report the error")
+    args=parser.parse_args()
+
+    if args.exact or is_binary_trace(args.trace) :
+        trace=load_trace(args.trace)
+    else :
+        trace=iter_reference_file(args.trace)
+    results=approximate_sweep(args.algorithms , trace , args.frames , args.rate , args.replicates , args.seed , args.min_scaled_frames)
+
+    report=[]
+    for result in results :
+        entry=result._asdict()
+        if args.exact :
+            exact_ratio=create_algorithm(result.algorithm , result.frames).simulate(trace) / len(trace) if len(trace) else 0.0
+            entry['exact_fault_ratio']=exact_ratio
+            entry['error']=result.fault_ratio - exact_ratio
+        report.append(entry)
+    print(json.dumps(report , indent=2))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
@@ -0,0 +1,89 @@
+# ARC (Adaptive Replacement Cache) page replacement algorithm (Megiddo & Modha)
+
+from collections import OrderedDict
+from typing import Any,Dict,Tuple
+from base import PageReplacementAlgorithm
+
+class ARC(PageReplacementAlgorithm) :
+    title="ARC Page Replacement Algorithm"
+
+    def reset(self) -> None :
+        # t1 : resident , seen once recently    t2 : resident , seen at least twice
+        # b1 / b2 : ghost lists of pages recently evicted from t1 / t2 (no frames used)
+        self.t1=OrderedDict()
+        self.t2=OrderedDict()
+        self.b1=OrderedDict()
+        self.b2=OrderedDict()
+        # adaptive target size for t1
+        self.target=0
+        self.page_faults=0
+        self.references=0
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.t1) + tuple(self.t2)
+
+    def export_state(self) -> Dict[str , Any] :
+        return {'t1' : list(self.t1) , 't2' : list(self.t2) , 'b1' : list(self.b1) , 'b2' : list(self.b2) , 'target' : self.target}
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        self.t1=OrderedDict.fromkeys(state['t1'])
+        self.t2=OrderedDict.fromkeys(state['t2'])
+        self.b1=OrderedDict.fromkeys(state['b1'])
+        self.b2=OrderedDict.fromkeys(state['b2'])
+        self.target=state['target']
+
+    def replace(self , in_b2 : bool) -> None :
+        # evict from t1 or t2 depending on the target , remembering the victim in a ghost list
+        t1_size=len(self.t1)
+        if self.t1 and (t1_size > self.target or (in_b2 and t1_size == self.target) or not self.t2) :
+            victim_page , _=self.t1.popitem(last=False)
+            self.b1[victim_page]=None
+        else :
+            victim_page , _=self.t2.popitem(last=False)
+            self.b2[victim_page]=None
+        self.last_victim=victim_page
+
+    def load_page(self , page : int) -> bool :
+        if page in self.t1 :
+            del self.t1[page]
+            self.t2[page]=None
+            return False
+        if page in self.t2 :
+            self.t2.move_to_end(page)
+            return False
+
+        self.last_victim=None
+        frames=self.frames
+
+        if page in self.b1 :
+            # recency is paying off , grow t1's target
+            self.target=min(frames , self.target + max(len(self.b2) // len(self.b1) , 1))
+            self.replace(False)
+            del self.b1[page]
+            self.t2[page]=None
+        elif page in self.b2 :
+            # frequency is paying off , shrink t1's target
+            self.target=max(0 , self.target - max(len(self.b1) // len(self.b2) , 1))
+            self.replace(True)
+            del self.b2[page]
+            self.t2[page]=None
+        else :
+            l1_size=len(self.t1) + len(self.b1)
+            if l1_size >= frames :
+                if len(self.t1) < frames :
+                    self.b1.popitem(last=False)
+                    self.replace(False)
+                else :
+                    self.last_victim , _=self.t1.popitem(last=False)
+            else :
+                total=l1_size + len(self.t2) + len(self.b2)
+                if total >= frames :
+                    if total >= 2 * frames :
+                        self.b2.popitem(last=False)
+                    self.replace(False)
+            self.t1[page]=None
+
+        self.page_faults += 1
+        return True
+
+# End of code
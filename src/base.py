@@ -0,0 +1,194 @@
+# shared simulation core for page replacement algorithms (no printing unless asked)
+
+from typing import Any,Dict,Iterable,Iterator,List,NamedTuple,Optional,Tuple
+from utils import Colors,print_algorithm_header
+
+# bump when the layout of get_state() changes
+STATE_VERSION=1
+
+class StepEvent(NamedTuple) :
+    # one processed reference
+    index : int
+    page : int
+    is_fault : bool
+    victim : Optional[int]
+    frames : Optional[Tuple[int, ...]]
+
+class PageReplacementAlgorithm :
+    title="Page Replacement Algorithm"
+    # True for algorithms whose prepare() needs the next-use array of the whole trace
+    needs_next_use=False
+    # trace compactions that provably leave page faults unchanged (see compaction.py) :
+    # dropping a reference equal to the previous one , and shortening a b a b a to a b a (frames >= 2)
+    collapses_repeats=False
+    collapses_ping_pong=False
+    # True for algorithms whose frame count can change mid-run (resize_frames() implemented)
+    resizable=False
+
+    def __init__(self , frames : int) :
+        self.frames=frames
+        self.page_faults=0
+        self.references=0
+        self.last_victim=None
+        self.reset()
+
+    def reset(self) -> None :
+        # clear frames and counters (page_faults , references) before a new simulation
+        raise NotImplementedError
+
+    def prepare(self , reference_string : Iterable[int]) -> None :
+        # hook for algorithms that need to look at the whole reference string first
+        pass
+
+    def load_page(self , page : int) -> bool :
+        # process one reference , return True on a page fault and set last_victim
+        raise NotImplementedError
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        # resident pages in display order
+        raise NotImplementedError
+
+    def engine_counters(self) -> Dict[str , int] :
+        # algorithm-specific statistics for instrumentation (computed after a run , not in load_page)
+        return {}
+
+    def resize_frames(self , frames : int) -> List[int] :
+        # hook : adapt frames and queues to a new frame count (self.frames is still the old one) ,
+        # evicting the way the policy would when shrinking , returns the evicted pages
+        raise NotImplementedError
+
+    def resize(self , frames : int) -> List[int] :
+        # change the frame count without resetting (per-process allocation , see multiprogram.py)
+        if not self.resizable :
+            raise TypeError(f"{type(self).__name__} cannot change its frame count")
+        if frames <= 0 :
+            raise ValueError(f"Number of frames must be a positive integer : {frames}")
+        evicted=self.resize_frames(frames)
+        self.frames=frames
+        return evicted
+
+    def check_feed(self , count : Optional[int]) -> None :
+        # hook : raise if `count` more references (None = unknown) cannot be fed right now
+        pass
+
+    def feed(self , page : int) -> bool :
+        # online API : process one more reference without resetting , True on a page fault
+        self.check_feed(1)
+        self.references += 1
+        return self.load_page(page)
+
+    def feed_many(self , pages : Iterable[int]) -> int :
+        # online API : process a batch of references without resetting , returns faults in the batch
+        size=len(pages) if hasattr(pages , '__len__') else None
+        self.check_feed(size)
+        faults=self.page_faults
+        load_page=self.load_page
+        if size is not None :
+            for page in pages :
+                load_page(page)
+            self.references += size
+        else :
+            count=0
+            for page in pages :
+                load_page(page)
+                count += 1
+            self.references += count
+        return self.page_faults - faults
+
+    def counters(self) -> Dict[str , Any] :
+        # live counters of the simulation so far
+        return {
+            'references' : self.references ,
+            'page_faults' : self.page_faults ,
+            'hits' : self.references - self.page_faults ,
+            'fault_ratio' : self.page_faults / self.references if self.references else 0.0 ,
+            'frames' : self.frames ,
+            'resident' : len(self.frame_snapshot())
+        }
+
+    def export_state(self) -> Dict[str , Any] :
+        # algorithm-specific state (frames , queues) as JSON-friendly lists and numbers
+        raise NotImplementedError
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        # inverse of export_state() , replaces the current frames and queues
+        raise NotImplementedError
+
+    def get_state(self) -> Dict[str , Any] :
+        # everything needed to resume this simulation later (see checkpoint.py)
+        return {
+            'version' : STATE_VERSION ,
+            'algorithm' : type(self).__name__ ,
+            'frames' : self.frames ,
+            'references' : self.references ,
+            'page_faults' : self.page_faults ,
+            'last_victim' : self.last_victim ,
+            'state' : self.export_state()
+        }
+
+    def set_state(self , state : Dict[str , Any]) -> None :
+        # resume from get_state() output , the frame count must match
+        if state.get('version') != STATE_VERSION :
+            raise ValueError(f"Unsupported state version : {state.get('version')}")
+        if state.get('algorithm') != type(self).__name__ :
+            raise ValueError(f"State belongs to {state.get('algorithm')} , not {type(self).__name__}")
+        if state.get('frames') != self.frames :
+            raise ValueError(f"State was saved with {state.get('frames')} frames , not {self.frames}")
+        self.import_state(state['state'])
+        self.references=state['references']
+        self.page_faults=state['page_faults']
+        self.last_victim=state['last_victim']
+
+    def simulate(self , reference_string : Iterable[int]) -> int :
+        # headless run , returns total page faults
+        self.reset()
+        self.prepare(reference_string)
+        self.feed_many(reference_string)
+        return self.page_faults
+
+    def steps(self , reference_string : Iterable[int] , snapshots : bool = True) -> Iterator[StepEvent] :
+        # headless run yielding one event per reference (frame snapshots are optional)
+        self.reset()
+        self.prepare(reference_string)
+        load_page=self.load_page
+        for a , page in enumerate(reference_string) :
+            is_fault=load_page(page)
+            self.references=a + 1
+            yield StepEvent(a , page , is_fault , self.last_victim if is_fault else None ,
+                            self.frame_snapshot() if snapshots else None)
+
+    def print_step(self , reference : int , current_index : int , total_references : int , is_fault : bool , victim_page : int = None) -> None :
+        step_info=f"Step {current_index + 1}/{total_references}"
+        page_info=f"Page: {reference}"
+        status=f"{Colors.RED}FAULT{Colors.RESET}" if is_fault else f"{Colors.GREEN}HIT{Colors.RESET}"
+
+        frames_display=[f"[{page}]" for page in self.frame_snapshot()]
+        frames_display.extend(["[ ]"] * (self.frames - len(frames_display)))
+
+        frames_str=" ".join(frames_display)
+        victim_info=f" (Replaced : {victim_page})" if victim_page is not None else ""
+
+        print(f"{Colors.CYAN}{step_info:<12}{Colors.RESET} | "
+              f"{Colors.YELLOW}{page_info:<8}{Colors.RESET} | "
+              f"Frames : {frames_str} | "
+              f"Status : {status}{victim_info}")
+
+    def run(self , reference_string : Iterable[int] , verbose : bool = True , renderer=None) -> int :
+        # verbose run prints every step (through `renderer` when given , see renderer.py) ,
+        # otherwise same as simulate()
+        if not verbose :
+            return self.simulate(reference_string)
+        if renderer is not None :
+            return renderer.render_run(self , reference_string)
+
+        print_algorithm_header(self.title)
+
+        # streamed reference strings have no known length
+        total_references=len(reference_string) if hasattr(reference_string , '__len__') else '?'
+
+        for event in self.steps(reference_string , snapshots=False) :
+            self.print_step(event.page , event.index , total_references , event.is_fault , event.victim)
+
+        return self.page_faults
+
+# End of code
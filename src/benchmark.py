@@ -0,0 +1,83 @@
+# reproducible benchmark : times every engine on seeded synthetic workloads and reports JSON
+
+import json
+import platform
+import time
+import tracemalloc
+from typing import Dict,List
+from registry import ALGORITHMS,create_algorithm
+from workloads import WORKLOADS,generate_workload
+
+DEFAULT_SIZES=[10 ** 3 , 10 ** 4 , 10 ** 5]
+
+def benchmark_engine(engine : str , reference_string : List[int] , frames : int , repeat : int = 1 , measure_memory : bool = True) -> Dict :
+    # best wall time of `repeat` headless runs , plus peak traced memory of one extra run
+    algorithm=create_algorithm(engine , frames)
+    best=None
+    for _ in range(repeat) :
+        start=time.perf_counter()
+        page_faults=algorithm.simulate(reference_string)
+        elapsed=time.perf_counter() - start
+        best=elapsed if best is None else min(best , elapsed)
+
+    peak_memory=None
+    if measure_memory :
+        # separate run , tracemalloc slows allocation down too much to time under it
+        tracemalloc.start()
+        algorithm.simulate(reference_string)
+        peak_memory=tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'engine' : engine,
+        'frames' : frames,
+        'page_faults' : page_faults,
+        'seconds' : best,
+        'references_per_second' : len(reference_string) / best if best else None,
+        'peak_memory_bytes' : peak_memory
+    }
+
+def run_benchmarks(workloads : List[str] , sizes : List[int] , engines : List[str] , frames : int = 64 , seed : int = 0 , repeat : int = 1 , measure_memory : bool = True) -> Dict :
+    results=[]
+    for workload in workloads :
+        for size in sizes :
+            reference_string=generate_workload(workload , size , seed=seed)
+            for engine in engines :
+                result=benchmark_engine(engine , reference_string , frames , repeat , measure_memory)
+                result.update({'workload' : workload , 'references' : size})
+                results.append(result)
+
+    return {
+        'python' : platform.python_version(),
+        'implementation' : platform.python_implementation(),
+        'platform' : platform.platform(),
+        'timestamp' : int(time.time()),
+        'seed' : seed,
+        'results' : results
+    }
+
+def main() -> None :
+    import argparse
+    parser=argparse.ArgumentParser(description="Benchmark the page replacement engines on synthetic workloads")
+    parser.add_argument('--workloads' , nargs='+' , default=list(WORKLOADS) , choices=list(WORKLOADS))
+    parser.add_argument('--sizes' , nargs='+' , type=int , default=DEFAULT_SIZES , help="references per trace (10^3 .. 10^7)")
+    parser.add_argument('--engines' , nargs='+' , default=list(ALGORITHMS) , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , type=int , default=64)
+    parser.add_argument('--seed' , type=int , default=0)
+    parser.add_argument('--repeat' , type=int , default=1 , help="timed runs per case , best is reported")
+    parser.add_argument('--no-memory' , action='store_true' , help="skip the peak-memory run")
+    parser.add_argument('--output' , help="write JSON here instead of stdout")
+    args=parser.parse_args()
+
+    report=run_benchmarks(args.workloads , args.sizes , args.engines , args.frames , args.seed , args.repeat , not args.no_memory)
+    text=json.dumps(report , indent=2)
+    if args.output :
+        with open(args.output , 'w') as f :
+            f.write(text + "\n")
+    else :
+        print(text)
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
@@ -0,0 +1,91 @@
+# checkpoint and resume long simulations : algorithm state is saved as a small JSON file ,
+# a replay that is interrupted continues from the last checkpoint instead of from zero
+
+import json
+import os
+from itertools import islice
+from typing import Any,Dict,Iterable
+from base import PageReplacementAlgorithm
+from registry import ALGORITHMS,create_algorithm
+
+DEFAULT_EVERY=1000000
+
+def save_checkpoint(algorithm : PageReplacementAlgorithm , filename : str) -> None :
+    data=json.dumps(algorithm.get_state() , separators=(',' , ':'))
+    # write then rename , so a crash mid-write leaves the previous checkpoint intact
+    temp_path=f"{filename}.{os.getpid()}.tmp"
+    with open(temp_path , 'w') as f :
+        f.write(data)
+    os.replace(temp_path , filename)
+
+def load_checkpoint(filename : str) -> Dict[str , Any] :
+    with open(filename , 'r') as f :
+        return json.load(f)
+
+def algorithm_key(state : Dict[str , Any]) -> str :
+    # registry key of the class a state was saved from
+    for key , info in ALGORITHMS.items() :
+        if info.cls.__name__ == state.get('algorithm') :
+            return key
+    raise ValueError(f"No registered algorithm for state of {state.get('algorithm')}")
+
+def restore_algorithm(state : Dict[str , Any] , reference_string : Iterable[int] = None) -> PageReplacementAlgorithm :
+    # a fresh algorithm continuing where `state` left off , look-ahead policies
+    # (Optimal) also need the same reference_string they were running on
+    algorithm=create_algorithm(algorithm_key(state) , state['frames'])
+    if algorithm.needs_next_use :
+        if reference_string is None :
+            raise TypeError(f"{type(algorithm).__name__} needs the reference string to resume")
+        algorithm.prepare(reference_string)
+    algorithm.set_state(state)
+    return algorithm
+
+def replay(key : str , reference_string : Iterable[int] , frames : int , checkpoint_file : str , every : int = DEFAULT_EVERY) -> PageReplacementAlgorithm :
+    # simulate `key` over reference_string , saving a checkpoint every `every` references ,
+    # resumes from checkpoint_file when it exists (the references it covers are skipped)
+    if every <= 0 :
+        raise ValueError(f"Checkpoint interval must be a positive integer : {every}")
+
+    if os.path.exists(checkpoint_file) :
+        state=load_checkpoint(checkpoint_file)
+        if algorithm_key(state) != key or state['frames'] != frames :
+            raise ValueError(f"{checkpoint_file} belongs to a different run ({state['algorithm']} , {state['frames']} frames)")
+        algorithm=restore_algorithm(state , reference_string)
+    else :
+        algorithm=create_algorithm(key , frames)
+        algorithm.prepare(reference_string)
+
+    remaining=islice(reference_string , algorithm.references , None)
+    while True :
+        batch=list(islice(remaining , every))
+        if not batch :
+            break
+        algorithm.feed_many(batch)
+        save_checkpoint(algorithm , checkpoint_file)
+    return algorithm
+
+def main() -> None :
+    import argparse
+    from trace_format import is_binary_trace,load_trace
+    from utils import iter_reference_file
+
+    parser=argparse.ArgumentParser(description="Replay a trace with periodic checkpoints , resuming from the last one")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithm' , default='lru' , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , type=int , required=True)
+    parser.add_argument('--checkpoint' , required=True , help="checkpoint file (resumed from when it exists)")
+    parser.add_argument('--every' , type=int , default=DEFAULT_EVERY , help="references between checkpoints")
+    args=parser.parse_args()
+
+    if ALGORITHMS[args.algorithm].cls.needs_next_use or is_binary_trace(args.trace) :
+        trace=load_trace(args.trace)
+    else :
+        # text traces are streamed , only the current batch is held in memory
+        trace=iter_reference_file(args.trace)
+    algorithm=replay(args.algorithm , trace , args.frames , args.checkpoint , args.every)
+    print(json.dumps(algorithm.counters() , indent=2))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
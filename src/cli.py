@@ -0,0 +1,158 @@
+# non-interactive batch entry point : traces x algorithms x frame counts -> JSON or CSV
+#
+# no prompts , sleeps or screen clears , and only the simulation core is imported ,
+# so it starts quickly enough to be called from scripts thousands of times
+
+import sys
+from typing import Dict,List,Optional,Sequence
+from fused import simulate_all
+from registry import ALGORITHMS
+from sweep import SweepResult,run_sweep
+
+INLINE_TRACE='<reference>'
+
+def parse_reference_string(text : str) -> List[int] :
+    # "1 2 3" or "1,2,3"
+    try :
+        return [int(token) for token in text.replace(',' , ' ').split()]
+    except ValueError :
+        raise ValueError(f"Reference string must contain integers only : {text!r}") from None
+
+def run_batch(trace_files : List[str] , algorithms : List[str] , frame_counts : List[int] , reference_string : Optional[Sequence[int]] = None , workers : int = 1 , cache_dir : str = None , address_options : Dict = None , out_of_core : bool = False) -> List[SweepResult] :
+    # one result per trace , algorithm and frame count , an inline reference_string comes first ,
+    # with address_options (keyword arguments of iter_address_trace) trace files are address traces ,
+    # with out_of_core their next-use arrays go to a memory-mapped side file (see out_of_core.py)
+    # repeated keys would share one result dict entry , keep the first occurrence of each
+    algorithms=list(dict.fromkeys(algorithms))
+    results=[]
+    if reference_string is not None :
+        for frames in frame_counts :
+            if frames <= 0 :
+                raise ValueError(f"Number of frames must be a positive integer : {frames}")
+            page_faults=simulate_all(algorithms , reference_string , frames)
+            results.extend(SweepResult(INLINE_TRACE , algorithm , frames , page_faults[algorithm] , len(reference_string))
+                           for algorithm in algorithms)
+        # same row order as run_sweep : algorithm , then frames
+        algorithm_order={algorithm : a for a , algorithm in enumerate(algorithms)}
+        results.sort(key=lambda result : algorithm_order[result.algorithm])
+
+    if trace_files and address_options is not None :
+        results.extend(run_address_traces(trace_files , algorithms , frame_counts , address_options))
+    elif trace_files and out_of_core :
+        results.extend(run_out_of_core(trace_files , algorithms , frame_counts))
+    elif trace_files :
+        cache=None
+        if cache_dir :
+            from result_cache import ResultCache
+            cache=ResultCache(cache_dir)
+        results.extend(run_sweep(trace_files , algorithms , frame_counts , workers , cache))
+    return results
+
+def run_address_traces(trace_files : List[str] , algorithms : List[str] , frame_counts : List[int] , address_options : Dict) -> List[SweepResult] :
+    # address traces are mapped to pages on the fly , re-read for every frame count unless
+    # an algorithm needs the whole trace
+    from address_trace import AddressTraceStats,iter_address_trace
+    needs_list=any(ALGORITHMS[algorithm].cls.needs_next_use for algorithm in algorithms)
+    results=[]
+    for filename in trace_files :
+        pages=list(iter_address_trace(filename , **address_options)) if needs_list else None
+        rows=[]
+        for frames in frame_counts :
+            if frames <= 0 :
+                raise ValueError(f"Number of frames must be a positive integer : {frames}")
+            stats=AddressTraceStats()
+            trace=pages if needs_list else iter_address_trace(filename , stats=stats , **address_options)
+            page_faults=simulate_all(algorithms , trace , frames)
+            references=len(pages) if needs_list else stats.references
+            rows.extend(SweepResult(filename , algorithm , frames , page_faults[algorithm] , references)
+                        for algorithm in algorithms)
+        algorithm_order={algorithm : a for a , algorithm in enumerate(algorithms)}
+        rows.sort(key=lambda result : algorithm_order[result.algorithm])
+        results.extend(rows)
+    return results
+
+def run_out_of_core(trace_files : List[str] , algorithms : List[str] , frame_counts : List[int]) -> List[SweepResult] :
+    # one next-use side file per trace , shared by every frame count
+    from out_of_core import simulate_out_of_core
+    results=[]
+    for filename in trace_files :
+        result=simulate_out_of_core(filename , algorithms , frame_counts)
+        results.extend(SweepResult(filename , algorithm , frames , result.page_faults[frames][algorithm] , result.references)
+                       for algorithm in algorithms for frames in frame_counts)
+    return results
+
+def result_rows(results : List[SweepResult]) -> List[Dict] :
+    return [{
+        'trace' : result.trace ,
+        'algorithm' : result.algorithm ,
+        'frames' : result.frames ,
+        'references' : result.references ,
+        'page_faults' : result.page_faults ,
+        'hits' : result.references - result.page_faults ,
+        'fault_ratio' : result.page_faults / result.references if result.references else 0.0
+    } for result in results]
+
+def format_json(results : List[SweepResult]) -> str :
+    import json
+    return json.dumps(result_rows(results) , indent=2)
+
+def format_csv(results : List[SweepResult]) -> str :
+    import csv
+    import io
+    output=io.StringIO()
+    rows=result_rows(results)
+    writer=csv.DictWriter(output , fieldnames=list(rows[0]) if rows else ['trace'] , lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue().rstrip("\n")
+
+FORMATTERS={'json' : format_json , 'csv' : format_csv}
+
+def main(argv : List[str] = None) -> int :
+    import argparse
+    parser=argparse.ArgumentParser(description="Run page replacement simulations without the interactive menu")
+    parser.add_argument('traces' , nargs='*' , help="text or binary trace files")
+    parser.add_argument('--reference' , help="inline reference string , e.g. \"1 2 3 4 1 2 5\"")
+    parser.add_argument('--algorithms' , nargs='+' , default=list(ALGORITHMS) , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , nargs='+' , type=int , required=True , help="frame counts to simulate")
+    parser.add_argument('--format' , choices=list(FORMATTERS) , default='json')
+    parser.add_argument('--output' , help="write here instead of stdout")
+    parser.add_argument('--workers' , type=int , default=1 , help="worker processes for trace files (default : 1 , no subprocesses)")
+    parser.add_argument('--cache-dir' , help="reuse and store results in this result cache directory")
+    parser.add_argument('--address-trace' , action='store_true' , help="trace files hold memory addresses ([TAG] ADDRESS per line)")
+    parser.add_argument('--page-size' , type=int , default=4096 , help="bytes per page for --address-trace")
+    parser.add_argument('--drop-instructions' , action='store_true' , help="ignore instruction fetches in address traces")
+    parser.add_argument('--collapse-repeats' , action='store_true' , help="drop accesses to the same page as the previous one in address traces")
+    parser.add_argument('--out-of-core' , action='store_true' , help="keep next-use arrays of trace files in a memory-mapped temporary file")
+    args=parser.parse_args(argv)
+
+    if not args.traces and args.reference is None :
+        parser.error("give at least one trace file or --reference")
+    try :
+        reference_string=parse_reference_string(args.reference) if args.reference is not None else None
+        address_options=None
+        if args.address_trace :
+            address_options={'page_size' : args.page_size , 'drop_instructions' : args.drop_instructions , 'collapse_repeats' : args.collapse_repeats}
+        if args.address_trace and (args.workers != 1 or args.cache_dir) :
+            parser.error("--workers and --cache-dir do not apply to --address-trace")
+        if args.out_of_core and args.address_trace :
+            parser.error("--out-of-core does not apply to --address-trace")
+        if args.out_of_core and (args.workers != 1 or args.cache_dir) :
+            parser.error("--workers and --cache-dir do not apply to --out-of-core")
+        results=run_batch(args.traces , args.algorithms , args.frames , reference_string , args.workers , args.cache_dir , address_options , args.out_of_core)
+    except (OSError , ValueError) as e :
+        print(f"error : {e}" , file=sys.stderr)
+        return 1
+
+    text=FORMATTERS[args.format](results)
+    if args.output :
+        with open(args.output , 'w') as f :
+            f.write(text + "\n")
+    else :
+        print(text)
+    return 0
+
+if __name__ == "__main__" :
+    sys.exit(main())
+
+# End of code
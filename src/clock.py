@@ -0,0 +1,66 @@
+# CLOCK (second-chance) page replacement algorithm
+
+from typing import Any,Dict,List,Tuple
+from base import PageReplacementAlgorithm
+
+class Clock(PageReplacementAlgorithm) :
+    title="CLOCK (Second-Chance) Page Replacement Algorithm"
+    collapses_repeats=True
+
+    def reset(self) -> None :
+        # frames form a circle , the hand points at the next eviction candidate
+        self.slots : List[int] = [None] * self.frames
+        self.reference_bits : List[bool] = [False] * self.frames
+        self.slot_of : Dict[int,int] = {}
+        self.hand=0
+        self.page_faults=0
+        self.references=0
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.slots[:len(self.slot_of)])
+
+    def export_state(self) -> Dict[str , Any] :
+        resident=len(self.slot_of)
+        return {
+            'pages' : self.slots[:resident] ,
+            'reference_bits' : [int(bit) for bit in self.reference_bits[:resident]] ,
+            'hand' : self.hand
+        }
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        pages=list(state['pages'])
+        padding=self.frames - len(pages)
+        self.slots=pages + [None] * padding
+        self.reference_bits=[bool(bit) for bit in state['reference_bits']] + [False] * padding
+        self.slot_of={page : slot for slot , page in enumerate(pages)}
+        self.hand=state['hand']
+
+    def load_page(self , page : int) -> bool :
+        slot=self.slot_of.get(page)
+        if slot is not None :
+            self.reference_bits[slot]=True
+            return False
+
+        if len(self.slot_of) < self.frames :
+            slot=len(self.slot_of)
+            self.last_victim=None
+        else :
+            # give referenced pages a second chance , clearing their bit as the hand passes
+            reference_bits=self.reference_bits
+            hand=self.hand
+            while reference_bits[hand] :
+                reference_bits[hand]=False
+                hand=(hand + 1) % self.frames
+            slot=hand
+            self.hand=(hand + 1) % self.frames
+            self.last_victim=self.slots[slot]
+            del self.slot_of[self.last_victim]
+
+        self.slots[slot]=page
+        self.reference_bits[slot]=True
+        self.slot_of[page]=slot
+        self.page_faults += 1
+
+        return True
+
+# End of code
@@ -0,0 +1,99 @@
+# trace compaction : drop references that are provably hits before simulating , then report
+# totals for the original trace
+#
+# repeats     a a -> a          the repeated page is resident and a hit changes no state for
+#                               FIFO , LRU , Optimal , CLOCK and 2Q (LFU counts it , ARC promotes it)
+# ping-pong   a b a b a -> a b a    with frames >= 2 , a and b are both resident after a b a , so the
+#                               rest of the alternation only hits. LRU ends up in the same recency
+#                               order , FIFO only changes on faults , and Optimal sees the same
+#                               next-use order at every fault because `a` still follows `b` right away
+#
+# removed references are all hits , so page faults are exact and hits = original length - faults
+
+from itertools import groupby
+from typing import Dict,Iterable,List,NamedTuple,Sequence,Tuple,Union
+from base import PageReplacementAlgorithm
+
+class CompactionResult(NamedTuple) :
+    references : int            # length of the original trace
+    compacted_references : int  # references actually simulated
+    page_faults : int
+    hits : int
+
+def compact_trace(reference_string : Iterable[int] , ping_pong : bool = False) -> List[int] :
+    # consecutive duplicates removed , and with ping_pong alternations of two pages cut down
+    # to their first two and last two references (a b a or a b a b)
+    compacted=[page for page , _ in groupby(reference_string)]
+    if not ping_pong :
+        return compacted
+
+    result=[]
+    append=result.append
+    # last four pages of result , oldest first
+    b4=b3=b2=b1=None
+    for page in compacted :
+        if page == b2 and page == b4 and b1 == b3 :
+            # ... a b a b + a -> ... a b a
+            result[-2:]=[page]
+            b4 , b3 , b2 , b1=(result[-4] if len(result) >= 4 else None) , b4 , b3 , page
+        else :
+            append(page)
+            b4 , b3 , b2 , b1=b3 , b2 , b1 , page
+    return result
+
+def compaction_modes(algorithm : PageReplacementAlgorithm) -> Tuple[bool , bool] :
+    # (repeats , ping_pong) compactions that are exact for this algorithm and frame count
+    repeats=algorithm.collapses_repeats
+    return repeats , repeats and algorithm.collapses_ping_pong and algorithm.frames >= 2
+
+class CompactedTrace :
+    # a trace with its compacted forms built on first use , so one compaction pass serves
+    # every algorithm and frame count simulated on it
+    def __init__(self , reference_string : Iterable[int]) :
+        if not hasattr(reference_string , '__len__') :
+            reference_string=list(reference_string)
+        self.original=reference_string
+        self.references=len(reference_string)
+        self.forms : Dict[bool , List[int]] = {}
+
+    def for_algorithm(self , algorithm : PageReplacementAlgorithm) -> Sequence[int] :
+        # the shortest form that is exact for `algorithm` , the original trace when none is
+        repeats , ping_pong=compaction_modes(algorithm)
+        if not repeats :
+            return self.original
+        compacted=self.forms.get(ping_pong)
+        if compacted is None :
+            # ping-pong compaction starts from the repeat-free form when that exists already
+            source=self.forms.get(False , self.original)
+            compacted=self.forms[ping_pong]=compact_trace(source , ping_pong)
+        return compacted
+
+def simulate_compacted(algorithm : PageReplacementAlgorithm , reference_string : Union[Iterable[int] , CompactedTrace]) -> CompactionResult :
+    # same page faults as algorithm.simulate(reference_string) , with less work on local traces
+    trace=reference_string if isinstance(reference_string , CompactedTrace) else CompactedTrace(reference_string)
+    compacted=trace.for_algorithm(algorithm)
+    page_faults=algorithm.simulate(compacted)
+    # counters() reports the original trace
+    algorithm.references=trace.references
+    return CompactionResult(trace.references , len(compacted) , page_faults , trace.references - page_faults)
+
+def main() -> None :
+    import argparse
+    import json
+    from registry import ALGORITHMS,create_algorithm
+    from trace_format import load_trace
+
+    parser=argparse.ArgumentParser(description="Simulate on a compacted trace (provable hits removed) and report exact totals")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithms' , nargs='+' , default=list(ALGORITHMS) , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , type=int , required=True)
+    args=parser.parse_args()
+
+    trace=CompactedTrace(load_trace(args.trace))
+    report={key : simulate_compacted(create_algorithm(key , args.frames) , trace)._asdict() for key in args.algorithms}
+    print(json.dumps(report , indent=2))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
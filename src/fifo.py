@@ -1,26 +1,60 @@
 # FIFO (First-In-First-Out) Page Replacement Algorithm
 
-from utils import Colors,print_algorithm_header
-from typing import List,Set
+from base import PageReplacementAlgorithm
+from utils import Colors
+from typing import Any,Dict,List,Set,Tuple
 
-class FIFO :
-    def __init__(self,frames : int):
-        self.frames=frames
-        self.page_queue = []
+class FIFO(PageReplacementAlgorithm) :
+    title = "FIFO Page Replacement Algorithm"
+    collapses_repeats = True
+    collapses_ping_pong = True
+    resizable = True
+    
+    def reset(self) -> None:
+        # fixed-capacity circular buffer , head points at the oldest page once it is full
+        self.slots : List[int] = [None] * self.frames
+        self.head = 0
         self.page_set : Set[int] = set()
-        self.page_faults=0
+        self.page_faults = 0
+        self.references = 0
+    
+    @property
+    def page_queue(self) -> List[int]:
+        # resident pages from oldest to newest (frame-slot order shown by print_step)
+        if len(self.page_set) < self.frames:
+            return self.slots[:len(self.page_set)]
+        return self.slots[self.head:] + self.slots[:self.head]
+    
+    def frame_snapshot(self) -> Tuple[int, ...]:
+        return tuple(self.page_queue)
+    
+    def export_state(self) -> Dict[str, Any]:
+        return {'pages': self.page_queue}
+    
+    def import_state(self, state: Dict[str, Any]) -> None:
+        # oldest page goes to slot 0 , which is where the head points once the frames are full
+        pages = list(state['pages'])
+        self.slots = pages + [None] * (self.frames - len(pages))
+        self.head = 0
+        self.page_set = set(pages)
+    
+    def resize_frames(self, frames: int) -> List[int]:
+        # the oldest pages go first , the rest is laid out from slot 0 like import_state()
+        pages = self.page_queue
+        evicted = pages[:max(0, len(pages) - frames)]
+        pages = pages[len(evicted):]
+        self.slots = pages + [None] * (frames - len(pages))
+        self.head = 0
+        self.page_set.difference_update(evicted)
+        return evicted
     
-    def print_step(self, reference: int, current_index: int, total_references: int, is_fault: bool) -> None:
+    def print_step(self, reference: int, current_index: int, total_references: int, is_fault: bool, victim_page: int = None) -> None:
         step_info = f"Step {current_index + 1}/{total_references}"
         page_info = f"Page : {reference}"
         status = f"{Colors.RED}FAULT{Colors.RESET}" if is_fault else f"{Colors.GREEN}HIT{Colors.RESET}"
         
-        frames_display = []
-        for a in range(self.frames):
-            if a < len(self.page_queue):
-                frames_display.append(f"[{self.page_queue[a]}]")
-            else:
-                frames_display.append(f"[ ]")
+        frames_display = [f"[{page}]" for page in self.page_queue]
+        frames_display.extend(["[ ]"] * (self.frames - len(frames_display)))
         
         frames_str = " ".join(frames_display)
         
@@ -35,27 +69,19 @@ class FIFO :
         if not is_fault:
             return False
         
-        if len(self.page_queue) >= self.frames:
-            removed_page = self.page_queue.pop(0)
-            self.page_set.remove(removed_page)
+        resident = len(self.page_set)
+        if resident >= self.frames:
+            # overwrite the oldest slot and advance the head
+            slot = self.head
+            self.last_victim = self.slots[slot]
+            self.page_set.remove(self.last_victim)
+            self.head = (slot + 1) % self.frames
+        else:
+            slot = resident
+            self.last_victim = None
         
-        self.page_queue.append(page)
+        self.slots[slot] = page
         self.page_set.add(page)
         self.page_faults += 1
         
         return True
-    
-    def run(self, reference_string: List[int]) -> int:
-        print_algorithm_header("FIFO Page Replacement Algorithm")
-        
-        self.page_queue = []
-        self.page_set = set()
-        self.page_faults = 0
-        
-        total_references = len(reference_string)
-        
-        for a, page in enumerate(reference_string) :
-            is_fault=self.load_page(page)
-            self.print_step(page, a, total_references, is_fault)
-        
-        return self.page_faults
\ No newline at end of file
@@ -0,0 +1,32 @@
+# fused multi-policy simulation : every selected algorithm advances in lockstep over one read of the trace
+
+from typing import Dict,Iterable,List,Sequence
+from preprocess import compute_next_use
+from registry import create_algorithm
+
+def simulate_all(algorithms : List[str] , reference_string : Iterable[int] , frames : int , next_use : Sequence[int] = None) -> Dict[str , int] :
+    # page faults per algorithm key , from a single traversal of reference_string
+    # (next_use may be given precomputed , e.g. memory-mapped by out_of_core.py)
+    engines=[create_algorithm(key , frames) for key in algorithms]
+
+    if next_use is None and any(engine.needs_next_use for engine in engines) :
+        # look-ahead policies need the whole trace , read it once and share the next-use array
+        if not hasattr(reference_string , '__getitem__') :
+            reference_string=list(reference_string)
+        next_use=compute_next_use(reference_string)
+
+    for engine in engines :
+        engine.reset()
+        if engine.needs_next_use :
+            engine.prepare(reference_string , next_use=next_use)
+        else :
+            engine.prepare(reference_string)
+
+    load_pages=[engine.load_page for engine in engines]
+    for page in reference_string :
+        for load_page in load_pages :
+            load_page(page)
+
+    return {key : engine.page_faults for key , engine in zip(algorithms , engines)}
+
+# End of code
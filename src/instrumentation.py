@@ -0,0 +1,185 @@
+# opt-in instrumentation : per-phase timings , per-engine counters , cProfile / sampling hooks , JSON dump
+#
+# nothing here is called from PageReplacementAlgorithm.simulate() , so uninstrumented runs pay nothing
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict,Iterable,Iterator
+from base import PageReplacementAlgorithm
+
+class Instrumentation :
+    def __init__(self) :
+        # phase name -> seconds (load , preprocess , simulate , render , ...)
+        self.phases : Dict[str , float]={}
+        # engine label -> counters
+        self.engines : Dict[str , Dict]={}
+        self.profile_report=None
+        self.samples=None
+
+    @contextmanager
+    def phase(self , name : str) -> Iterator[None] :
+        start=time.perf_counter()
+        try :
+            yield
+        finally :
+            self.phases[name]=self.phases.get(name , 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def profile(self , sort : str = 'cumulative' , limit : int = 25) -> Iterator[None] :
+        # deterministic profile of the enclosed block , kept as a text report
+        profiler=cProfile.Profile()
+        profiler.enable()
+        try :
+            yield
+        finally :
+            profiler.disable()
+            out=io.StringIO()
+            pstats.Stats(profiler , stream=out).sort_stats(sort).print_stats(limit)
+            self.profile_report=out.getvalue()
+
+    @contextmanager
+    def sample(self , interval : float = 0.005 , limit : int = 25) -> Iterator[None] :
+        # low-overhead statistical profile : a background thread records where the
+        # calling thread is every `interval` seconds
+        target=threading.get_ident()
+        counts=Counter()
+        stop=threading.Event()
+
+        def sampler() -> None :
+            while not stop.wait(interval) :
+                frame=sys._current_frames().get(target)
+                if frame is not None :
+                    code=frame.f_code
+                    counts[f"{code.co_filename}:{code.co_name}:{frame.f_lineno}"] += 1
+
+        thread=threading.Thread(target=sampler , daemon=True)
+        thread.start()
+        try :
+            yield
+        finally :
+            stop.set()
+            thread.join()
+            total=sum(counts.values())
+            self.samples={
+                'interval' : interval ,
+                'total' : total ,
+                'top' : [{'location' : location , 'samples' : count , 'share' : count / total}
+                         for location , count in counts.most_common(limit)]
+            }
+
+    def to_dict(self) -> Dict :
+        return {
+            'phases' : self.phases ,
+            'engines' : self.engines ,
+            'profile' : self.profile_report ,
+            'samples' : self.samples
+        }
+
+    def to_json(self , indent : int = 2) -> str :
+        return json.dumps(self.to_dict() , indent=indent)
+
+    def dump(self , filename : str) -> None :
+        with open(filename , 'w') as f :
+            f.write(self.to_json() + "\n")
+
+def instrumented_simulate(algorithm : PageReplacementAlgorithm , reference_string : Iterable[int] , instrumentation : Instrumentation , label : str = None , verbose : bool = False) -> int :
+    # same result as algorithm.simulate() (or run() when verbose) , but times every phase and
+    # splits per-reference time into hit path and fault path
+    label=label or type(algorithm).__name__
+    clock=time.perf_counter
+
+    algorithm.reset()
+    with instrumentation.phase('preprocess') :
+        algorithm.prepare(reference_string)
+
+    total_references=len(reference_string) if hasattr(reference_string , '__len__') else '?'
+    load_page=algorithm.load_page
+    references=hits=evictions=0
+    hit_time=fault_time=render_time=0.0
+
+    with instrumentation.phase('simulate') :
+        for page in reference_string :
+            start=clock()
+            is_fault=load_page(page)
+            elapsed=clock() - start
+            if is_fault :
+                fault_time += elapsed
+                if algorithm.last_victim is not None :
+                    evictions += 1
+            else :
+                hit_time += elapsed
+                hits += 1
+            if verbose :
+                start=clock()
+                algorithm.print_step(page , references , total_references , is_fault , algorithm.last_victim if is_fault else None)
+                render_time += clock() - start
+            references += 1
+    algorithm.references=references
+
+    if verbose :
+        # printing happened inside the simulate phase , move it to its own phase
+        instrumentation.phases['simulate'] -= render_time
+        instrumentation.phases['render']=instrumentation.phases.get('render' , 0.0) + render_time
+
+    counters={
+        'frames' : algorithm.frames ,
+        'references' : references ,
+        'hits' : hits ,
+        'page_faults' : algorithm.page_faults ,
+        'evictions' : evictions ,
+        'hit_path_seconds' : hit_time ,
+        'fault_path_seconds' : fault_time ,
+        'mean_hit_ns' : hit_time / hits * 1e9 if hits else None ,
+        'mean_fault_ns' : fault_time / algorithm.page_faults * 1e9 if algorithm.page_faults else None
+    }
+    counters.update(algorithm.engine_counters())
+    instrumentation.engines[label]=counters
+    return algorithm.page_faults
+
+def main() -> None :
+    import argparse
+    from registry import ALGORITHMS,create_algorithm
+    from trace_format import load_trace
+
+    parser=argparse.ArgumentParser(description="Run simulations with timing , counters and optional profiling , report JSON")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithms' , nargs='+' , default=list(ALGORITHMS) , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , type=int , required=True)
+    parser.add_argument('--profile' , action='store_true' , help="attach a cProfile report")
+    parser.add_argument('--sample' , action='store_true' , help="attach a sampling profile")
+    parser.add_argument('--output' , help="write JSON here instead of stdout")
+    args=parser.parse_args()
+
+    instrumentation=Instrumentation()
+    with instrumentation.phase('load') :
+        trace=load_trace(args.trace)
+
+    def run_all() -> None :
+        for key in args.algorithms :
+            instrumented_simulate(create_algorithm(key , args.frames) , trace , instrumentation , label=key)
+
+    if args.profile :
+        with instrumentation.profile() :
+            run_all()
+    elif args.sample :
+        with instrumentation.sample() :
+            run_all()
+    else :
+        run_all()
+
+    if args.output :
+        instrumentation.dump(args.output)
+    else :
+        print(instrumentation.to_json())
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
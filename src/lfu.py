@@ -0,0 +1,66 @@
+# LFU (Least Frequently Used) page replacement algorithm
+
+from collections import OrderedDict
+from typing import Any,Dict,Tuple
+from base import PageReplacementAlgorithm
+
+class LFU(PageReplacementAlgorithm) :
+    title="LFU Page Replacement Algorithm"
+
+    def reset(self) -> None :
+        # resident page -> reference count (in load order , for display)
+        self.frequency : Dict[int,int] = {}
+        # reference count -> pages with that count , least recently used first (breaks ties)
+        self.buckets : Dict[int,OrderedDict] = {}
+        self.min_frequency=0
+        self.page_faults=0
+        self.references=0
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.frequency)
+
+    def export_state(self) -> Dict[str , Any] :
+        # pages in load order , and every bucket's tie-break order
+        return {
+            'pages' : [[page , count] for page , count in self.frequency.items()] ,
+            'buckets' : [[count , list(bucket)] for count , bucket in self.buckets.items()] ,
+            'min_frequency' : self.min_frequency
+        }
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        self.frequency={page : count for page , count in state['pages']}
+        self.buckets={count : OrderedDict.fromkeys(pages) for count , pages in state['buckets']}
+        self.min_frequency=state['min_frequency']
+
+    def load_page(self , page : int) -> bool :
+        count=self.frequency.get(page)
+        if count is not None :
+            # move the page up one frequency bucket
+            bucket=self.buckets[count]
+            del bucket[page]
+            if not bucket :
+                del self.buckets[count]
+                if self.min_frequency == count :
+                    self.min_frequency=count + 1
+            self.frequency[page]=count + 1
+            self.buckets.setdefault(count + 1 , OrderedDict())[page]=None
+            return False
+
+        if len(self.frequency) >= self.frames :
+            bucket=self.buckets[self.min_frequency]
+            victim_page , _=bucket.popitem(last=False)
+            if not bucket :
+                del self.buckets[self.min_frequency]
+            del self.frequency[victim_page]
+            self.last_victim=victim_page
+        else :
+            self.last_victim=None
+
+        self.frequency[page]=1
+        self.buckets.setdefault(1 , OrderedDict())[page]=None
+        self.min_frequency=1
+        self.page_faults += 1
+
+        return True
+
+# End of code
@@ -1,26 +1,45 @@
 # LRU (Least Recently Used) Page Replacement Algorithm
 
-from typing import List,Set
-from utils import Colors,print_algorithm_header
+from collections import OrderedDict
+from typing import Any,Dict,List,Tuple
+from base import PageReplacementAlgorithm
+from utils import Colors
 
-class LRU :
-    def __init__(self , frames : int) :
-        self.frames=frames
-        self.page_list=[]
-        self.page_set : Set[int]=set()
+class LRU(PageReplacementAlgorithm) :
+    title="LRU Page Replacement Algorithm"
+    collapses_repeats=True
+    collapses_ping_pong=True
+    resizable=True
+    
+    def reset(self) -> None :
+        # resident pages in recency order (least recently used first)
+        self.page_list : OrderedDict=OrderedDict()
         self.page_faults=0
+        self.references=0
+    
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.page_list)
+    
+    def export_state(self) -> Dict[str , Any] :
+        return {'pages' : list(self.page_list)}
     
-    def print_step(self , reference : int , current_index : int , total_references : int , is_fault : bool) -> None :
+    def import_state(self , state : Dict[str , Any]) -> None :
+        self.page_list=OrderedDict.fromkeys(state['pages'])
+    
+    def resize_frames(self , frames : int) -> List[int] :
+        # least recently used pages go first
+        evicted=[]
+        while len(self.page_list) > frames :
+            evicted.append(self.page_list.popitem(last=False)[0])
+        return evicted
+    
+    def print_step(self , reference : int , current_index : int , total_references : int , is_fault : bool , victim_page : int = None) -> None :
         step_info=f"Step {current_index + 1}/{total_references}"
         page_info=f"Page: {reference}"
         status=f"{Colors.RED}FAULT{Colors.RESET}" if is_fault else f"{Colors.GREEN}HIT{Colors.RESET}"
         
-        frames_display=[]
-        for a in range(self.frames) :
-            if a < len(self.page_list) :
-                frames_display.append(f"[{self.page_list[a]}]")
-            else :
-                frames_display.append(f"[ ]")
+        frames_display=[f"[{page}]" for page in self.page_list]
+        frames_display.extend(["[ ]"] * (self.frames - len(frames_display)))
         
         frames_str = " ".join(frames_display)
         
@@ -30,34 +49,18 @@ class LRU :
               f"Status : {status}")
     
     def load_page(self , page : int) -> bool :
-        is_fault=page not in self.page_set
-        
-        if is_fault :
-            if len(self.page_list) >= self.frames:
-                removed_page = self.page_list.pop(0)
-                self.page_set.remove(removed_page)
-            
-            self.page_list.append(page)
-            self.page_set.add(page)
-            self.page_faults += 1
-        else :
+        if page in self.page_list :
             # page hit - move to end (most recently used)
-            self.page_list.remove(page)
-            self.page_list.append(page)
-        
-        return is_fault
-    
-    def run(self , reference_string: List[int]) -> int:
-        print_algorithm_header("LRU Page Replacement Algorithm")
+            self.page_list.move_to_end(page)
+            return False
         
-        self.page_list=[]
-        self.page_set=set()
-        self.page_faults=0
-        
-        total_references=len(reference_string)
+        if len(self.page_list) >= self.frames:
+            # evict the least recently used page from the front
+            self.last_victim=self.page_list.popitem(last=False)[0]
+        else :
+            self.last_victim=None
         
-        for a , page in enumerate(reference_string):
-            is_fault = self.load_page(page)
-            self.print_step(page , a , total_references , is_fault)
+        self.page_list[page]=None
+        self.page_faults += 1
         
-        return self.page_faults
\ No newline at end of file
+        return True
@@ -1,9 +1,9 @@
 import sys
 import time
-from lru import LRU
-from fifo import FIFO
-from optimal import Optimal
-from typing import List
+from registry import ALGORITHMS
+from renderer import StepRenderer
+from stack_distance import lru_fault_curve,opt_fault_curve
+from typing import List,Tuple
 from utils import Colors,clear_screen,print_header,print_success,print_error,print_warning,print_info
 
 def get_reference_string() -> List[int] :
@@ -39,7 +39,7 @@ def get_number_of_frames() -> int :
                 print_error("Number of frames must be a positive integer. Please try again.")
                 continue
             elif frames > 50:
-                print_warning("Large number of frames detected. This may affect display readability.")
+                print_warning("Large number of frames detected. Frame display will be abbreviated.")
                 confirm = input(f"{Colors.YELLOW}Continue anyway? (y/n): {Colors.RESET}").strip().lower()
                 if confirm not in ['y', 'yes']:
                     continue
@@ -50,21 +50,30 @@ def get_number_of_frames() -> int :
             print(f"\n{Colors.YELLOW}Program interrupted by user.{Colors.RESET}")
             sys.exit(0)
 
+MENU_ACTIONS = [
+    ('compare', 'Compare All Algorithms'),
+    ('help', 'Help'),
+    ('curve', 'Fault Curve (LRU/OPT for every frame count)')
+]
+
+def get_menu_options() -> List[Tuple[str, str]] :
+    # every registered algorithm , followed by the other actions
+    return [(info.key, info.name) for info in ALGORITHMS.values()] + MENU_ACTIONS
+
 def get_algorithm_choice() -> str:
+    options = get_menu_options()
+    
     print_header("Choose the algorithm to run:")
-    print(f"{Colors.GREEN}1.{Colors.RESET} FIFO (First-In-First-Out)")
-    print(f"{Colors.GREEN}2.{Colors.RESET} LRU (Least Recently Used)")
-    print(f"{Colors.GREEN}3.{Colors.RESET} OPR/OPT (Optimal)")
-    print(f"{Colors.GREEN}4.{Colors.RESET} Compare All Algorithms")
-    print(f"{Colors.GREEN}5.{Colors.RESET} Help")
+    for a , (key , label) in enumerate(options , 1) :
+        print(f"{Colors.GREEN}{a}.{Colors.RESET} {label}")
     
     while True:
         try : 
-            choice = input(f"{Colors.CYAN}Enter your choice (1-5): {Colors.RESET}").strip()
-            if choice in ['1', '2', '3', '4', '5']:
-                return choice
+            choice = input(f"{Colors.CYAN}Enter your choice (1-{len(options)}): {Colors.RESET}").strip()
+            if choice.isdigit() and 1 <= int(choice) <= len(options):
+                return options[int(choice) - 1][0]
             else:
-                print_error("Please enter 1, 2, 3, 4, or 5 for your choice. Try again.")
+                print_error(f"Please enter a number from 1 to {len(options)} for your choice. Try again.")
         except KeyboardInterrupt:
             print(f"\n{Colors.YELLOW}Program interrupted by user.{Colors.RESET}")
             sys.exit(0)
@@ -89,29 +98,48 @@ def show_help() :
     print("  - Used as a benchmark for other algorithms")
     print()
     
+    print(f"{Colors.CYAN}CLOCK (Second-Chance):{Colors.RESET}")
+    print("  - FIFO over a circle of frames with a reference bit per frame")
+    print("  - Referenced pages get a second chance instead of being evicted")
+    print()
+    
+    print(f"{Colors.CYAN}LFU (Least Frequently Used):{Colors.RESET}")
+    print("  - Replaces the page with the fewest references since it was loaded")
+    print("  - Ties are broken by least recent use")
+    print()
+    
+    print(f"{Colors.CYAN}ARC (Adaptive Replacement Cache):{Colors.RESET}")
+    print("  - Balances recency and frequency lists using ghost entries of evicted pages")
+    print("  - Adapts to the workload without tuning")
+    print()
+    
+    print(f"{Colors.CYAN}2Q (Two-Queue):{Colors.RESET}")
+    print("  - New pages wait in a small FIFO queue; pages referenced again move to an LRU queue")
+    print("  - Resists pollution from one-time scans")
+    print()
+    
     input(f"{Colors.YELLOW}Press Enter to continue...{Colors.RESET}")
 
+# above this many references (or frames) steps go through the buffered renderer , sampled
+# down to about MAX_SHOWN_STEPS lines
+LARGE_TRACE=1000
+LARGE_FRAMES=50
+MAX_SHOWN_STEPS=1000
+
+def get_renderer(reference_string : List[int] , frames : int) :
+    if len(reference_string) <= LARGE_TRACE and frames <= LARGE_FRAMES :
+        return None
+    return StepRenderer(every=-(-len(reference_string) // MAX_SHOWN_STEPS))
+
 def run_single_algorithm(choice: str, reference_string: List[int], frames: int) -> None:
-    algorithms={
-        '1': FIFO,
-        '2': LRU,
-        '3': Optimal
-    }
-    
-    algorithm_names = {
-        '1': 'FIFO (First-In-First-Out)',
-        '2': 'LRU (Least Recently Used)',
-        '3': 'Optimal'
-    }
-    
-    if choice in algorithms :
-        algorithm=algorithms[choice](frames)
-        algorithm_name=algorithm_names[choice]
+    if choice in ALGORITHMS :
+        algorithm=ALGORITHMS[choice].cls(frames)
+        algorithm_name=ALGORITHMS[choice].name
         
         print_header(f"Running {algorithm_name} Algorithm")
         time.sleep(0.5)
         
-        page_faults = algorithm.run(reference_string)
+        page_faults = algorithm.run(reference_string , renderer=get_renderer(reference_string , frames))
         
         print_header("Results Summary")
         print(f"{Colors.GREEN}Algorithm:{Colors.RESET} {algorithm_name}")
@@ -127,18 +155,17 @@ def run_comparison(reference_string : List[int] , frames : int) -> None :
     print(f"{Colors.BLUE}Number of Frames :{Colors.RESET} {frames}")
     print()
     
-    algorithms = [
-        (FIFO(frames),"FIFO"),
-        (LRU(frames),"LRU"),
-        (Optimal(frames),"OPTIMAL")
-    ]
+    algorithms = [(info.cls(frames), info.short_name) for info in ALGORITHMS.values()]
     
     results=[]
     
+    # one pass per policy on purpose : each prints its own step view (sampled on large traces) ,
+    # which needs that engine's frames at every shown step , so fused.simulate_all would only add
+    # a pass. the faults for the table come from these same runs
     for algorithm , name in algorithms :
         print_header(f"Running {name} Algorithm")
         time.sleep(0.3)
-        page_faults=algorithm.run(reference_string)
+        page_faults=algorithm.run(reference_string , renderer=get_renderer(reference_string , frames))
         results.append((name,page_faults))
         print()
     
@@ -153,10 +180,28 @@ def run_comparison(reference_string : List[int] , frames : int) -> None :
         color = Colors.GREEN if faults==min_faults else Colors.RESET
         print(f"{color}{name:<15}{Colors.RESET} {faults:<15} {efficiency:<15}")
 
+def run_fault_curve(reference_string : List[int] , frames : int) -> None :
+    # LRU and OPT are stack algorithms , so one pass gives faults for frames 1..frames
+    print_header("Fault Curve")
+    print(f"{Colors.BLUE}Reference String :{Colors.RESET} {' '.join(map(str,reference_string))}")
+    print(f"{Colors.BLUE}Frames :{Colors.RESET} 1 - {frames}")
+    print()
+    
+    lru_faults=lru_fault_curve(reference_string , frames)
+    opt_faults=opt_fault_curve(reference_string , frames)
+    
+    print(f"{'Frames':<10} {'LRU Faults':<15} {'OPT Faults':<15}")
+    print("-" * 40)
+    
+    for a in range(frames) :
+        print(f"{a + 1:<10} {lru_faults[a]:<15} {opt_faults[a]:<15}")
+
 def run_algorithm(choice : str , reference_string : List[int], frames: int) -> None :
-    if choice=='4' :
+    if choice=='compare' :
         run_comparison(reference_string , frames)
-    elif choice=='5' :
+    elif choice=='curve' :
+        run_fault_curve(reference_string , frames)
+    elif choice=='help' :
         show_help()
         return
     else :
@@ -199,7 +244,7 @@ def main() :
             
             choice=get_algorithm_choice()
             
-            if choice=='5' :
+            if choice=='help' :
                 show_help()
                 continue
             
@@ -228,4 +273,5 @@ def main() :
         print_error(f"An unexpected error occurred: {e}")
         sys.exit(1)
 
-main()
\ No newline at end of file
+if __name__ == "__main__" :
+    main()
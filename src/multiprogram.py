@@ -0,0 +1,318 @@
+# multiprogrammed workloads : several processes share one pool of frames
+#
+# global replacement   one engine over all processes , page p of process i is the page
+#                      p * processes + i , so a fault may evict another process's page
+# local replacement    one engine per process , each with its own frames :
+#   fixed              frames split equally
+#   proportional       frames split by process size (distinct pages)
+#   pff                page-fault frequency : one frame each to start , the rest in a free pool.
+#                      a process whose faults come less than pff_interval of its own references
+#                      apart gets a frame from the pool (or is denied one when the pool is empty) ,
+#                      one with faults farther apart gives a frame back. needs resizable engines
+#                      (FIFO , LRU , Optimal)
+#
+# per-reference work is a few list lookups by process index , so it does not grow with the
+# number of processes. thrashing shows up as windows of the interleaved trace whose fault
+# ratio reaches thrashing_threshold , frames stolen across processes (global) and denied
+# growth requests (pff)
+
+from collections import Counter
+from typing import Dict,List,NamedTuple,Sequence
+from registry import create_algorithm
+
+MODES=('global' , 'fixed' , 'proportional' , 'pff')
+DEFAULT_QUANTUM=100
+DEFAULT_WINDOW=1000
+DEFAULT_THRASHING_THRESHOLD=0.5
+DEFAULT_PFF_INTERVAL=100
+
+class Workload(NamedTuple) :
+    names : List[str]   # process names , indexed by process number
+    pids : List[int]    # process number of every reference , in execution order
+    pages : List[int]   # page of every reference (the process's own page numbers)
+
+class ProcessStats(NamedTuple) :
+    name : str
+    references : int
+    page_faults : int
+    fault_ratio : float
+    frames : int          # frames held at the end (resident pages with global replacement)
+    min_frames : int
+    max_frames : int
+    frames_stolen : int   # own pages evicted by other processes' faults (global)
+    denied_growth : int   # pff requests for a frame while the free pool was empty
+
+class MultiprogramResult(NamedTuple) :
+    algorithm : str
+    mode : str
+    frames : int
+    references : int
+    page_faults : int
+    fault_ratio : float
+    windows : int
+    thrashing_windows : int       # windows with a fault ratio >= thrashing_threshold
+    peak_window_fault_ratio : float
+    thrashing_processes : int     # processes with a fault ratio >= thrashing_threshold
+    processes : List[ProcessStats]
+
+def interleave(traces : Dict[str , Sequence[int]] , quantum : int = DEFAULT_QUANTUM) -> Workload :
+    # round-robin schedule : each process runs `quantum` references in turn until its trace ends
+    if quantum <= 0 :
+        raise ValueError(f"Quantum must be a positive integer : {quantum}")
+    names=list(traces)
+    sequences=[traces[name] for name in names]
+    pids=[]
+    pages=[]
+    offset=0
+    running=[pid for pid , sequence in enumerate(sequences) if len(sequence)]
+    while running :
+        for pid in running :
+            chunk=sequences[pid][offset:offset + quantum]
+            pages.extend(chunk)
+            pids.extend([pid] * len(chunk))
+        offset += quantum
+        running=[pid for pid in running if len(sequences[pid]) > offset]
+    return Workload(names , pids , pages)
+
+def load_tagged_trace(filename : str) -> Workload :
+    # one `PID PAGE` pair per line , in execution order ('#' comments and blank lines skipped)
+    numbers : Dict[str , int] = {}
+    pids=[]
+    pages=[]
+    with open(filename , 'r') as f :
+        for line_number , line in enumerate(f , 1) :
+            tokens=line.split()
+            if not tokens or tokens[0].startswith('#') :
+                continue
+            try :
+                name , page=tokens[0] , int(tokens[1])
+            except (IndexError , ValueError) :
+                raise ValueError(f"{filename}:{line_number} : expected `PID PAGE` , got {line.strip()!r}") from None
+            pid=numbers.get(name)
+            if pid is None :
+                pid=numbers[name]=len(numbers)
+            pids.append(pid)
+            pages.append(page)
+    return Workload(list(numbers) , pids , pages)
+
+def split_workload(workload : Workload) -> List[List[int]] :
+    # every process's own reference string
+    traces=[[] for _ in workload.names]
+    for pid , page in zip(workload.pids , workload.pages) :
+        traces[pid].append(page)
+    return traces
+
+def allocate_frames(frames : int , weights : List[int]) -> List[int] :
+    # at least one frame each , the rest split by weight (largest remainders get the leftovers)
+    count=len(weights)
+    if frames < count :
+        raise ValueError(f"Local replacement needs at least one frame per process : {frames} frames , {count} processes")
+    spare=frames - count
+    total=sum(weights)
+    if not total :
+        weights , total=[1] * count , count
+    shares=[spare * weight / total for weight in weights]
+    allocation=[1 + int(share) for share in shares]
+    by_remainder=sorted(range(count) , key=lambda pid : int(shares[pid]) - shares[pid])
+    for pid in by_remainder[:frames - sum(allocation)] :
+        allocation[pid] += 1
+    return allocation
+
+def run_windows(workload : Workload , step , window : int) -> List[int] :
+    # drives step(start , end) -> faults over consecutive windows , returns faults per window
+    window_faults=[]
+    total_references=len(workload.pages)
+    for start in range(0 , total_references , window) :
+        window_faults.append(step(start , min(start + window , total_references)))
+    return window_faults
+
+def simulate_global(key : str , workload : Workload , frames : int , window : int = DEFAULT_WINDOW , thrashing_threshold : float = DEFAULT_THRASHING_THRESHOLD) -> MultiprogramResult :
+    # one engine , one pool : victims are chosen among all processes' pages
+    count=len(workload.names)
+    pids=workload.pids
+    encoded=[page * count + pid for pid , page in zip(pids , workload.pages)]
+    engine=create_algorithm(key , frames)
+    engine.reset()
+    engine.prepare(encoded)
+    load_page=engine.load_page
+    faults=[0] * count
+    resident=[0] * count
+    peak=[0] * count
+    stolen=[0] * count
+
+    def step(start : int , end : int) -> int :
+        window_faults=0
+        for a in range(start , end) :
+            if load_page(encoded[a]) :
+                pid=pids[a]
+                window_faults += 1
+                faults[pid] += 1
+                victim=engine.last_victim
+                if victim is not None :
+                    owner=victim % count
+                    resident[owner] -= 1
+                    if owner != pid :
+                        stolen[owner] += 1
+                held=resident[pid]=resident[pid] + 1
+                if held > peak[pid] :
+                    peak[pid]=held
+        return window_faults
+
+    window_faults=run_windows(workload , step , window)
+    engine.references=len(encoded)
+    references=Counter(pids)
+    processes=[ProcessStats(name , references[pid] , faults[pid] , faults[pid] / references[pid] if references[pid] else 0.0 ,
+                            resident[pid] , 0 , peak[pid] , stolen[pid] , 0)
+               for pid , name in enumerate(workload.names)]
+    return summarize(key , 'global' , frames , window , window_faults , thrashing_threshold , processes)
+
+def simulate_local(key : str , workload : Workload , frames : int , mode : str = 'fixed' , window : int = DEFAULT_WINDOW , thrashing_threshold : float = DEFAULT_THRASHING_THRESHOLD , pff_interval : int = DEFAULT_PFF_INTERVAL) -> MultiprogramResult :
+    # one engine per process , frames allocated by `mode` (fixed , proportional or pff)
+    if mode not in ('fixed' , 'proportional' , 'pff') :
+        raise ValueError(f"Unknown allocation mode : {mode} (choose from fixed , proportional , pff)")
+    traces=split_workload(workload)
+    count=len(traces)
+    weights=[len(set(trace)) for trace in traces] if mode == 'proportional' else [1] * count
+    # raises for fewer frames than processes , in every mode
+    allocation=allocate_frames(frames , weights)
+    if mode == 'pff' :
+        # one frame each to start , the rest goes to the free pool
+        allocation=[1] * count
+    engines=[create_algorithm(key , allocation[pid]) for pid in range(count)]
+    if mode == 'pff' and count and not engines[0].resizable :
+        raise ValueError(f"{key} cannot change its frame count , pff needs fifo , lru or optimal")
+    for engine , trace in zip(engines , traces) :
+        engine.reset()
+        engine.prepare(trace)
+    loads=[engine.load_page for engine in engines]
+    pids=workload.pids
+    pages=workload.pages
+
+    if mode != 'pff' :
+        def step(start : int , end : int) -> int :
+            window_faults=0
+            for a in range(start , end) :
+                if loads[pids[a]](pages[a]) :
+                    window_faults += 1
+            return window_faults
+        lowest=highest=allocation
+        denied=[0] * count
+    else :
+        # process virtual time (own references so far) , and at its last fault
+        clock=[0] * count
+        last_fault=[0] * count
+        lowest=list(allocation)
+        highest=list(allocation)
+        denied=[0] * count
+        pool=[frames - count]
+
+        def step(start : int , end : int) -> int :
+            window_faults=0
+            for a in range(start , end) :
+                pid=pids[a]
+                now=clock[pid]=clock[pid] + 1
+                if loads[pid](pages[a]) :
+                    window_faults += 1
+                    interval=now - last_fault[pid]
+                    last_fault[pid]=now
+                    engine=engines[pid]
+                    if interval < pff_interval :
+                        if pool[0] > 0 :
+                            pool[0] -= 1
+                            engine.resize(engine.frames + 1)
+                            if engine.frames > highest[pid] :
+                                highest[pid]=engine.frames
+                        else :
+                            denied[pid] += 1
+                    elif interval > pff_interval and engine.frames > 1 :
+                        engine.resize(engine.frames - 1)
+                        pool[0] += 1
+                        if engine.frames < lowest[pid] :
+                            lowest[pid]=engine.frames
+            return window_faults
+
+    window_faults=run_windows(workload , step , window)
+    processes=[]
+    for pid , (name , engine , trace) in enumerate(zip(workload.names , engines , traces)) :
+        engine.references=len(trace)
+        processes.append(ProcessStats(name , len(trace) , engine.page_faults , engine.page_faults / len(trace) if trace else 0.0 ,
+                                      engine.frames , lowest[pid] , highest[pid] , 0 , denied[pid]))
+    return summarize(key , mode , frames , window , window_faults , thrashing_threshold , processes)
+
+def summarize(key : str , mode : str , frames : int , window : int , window_faults : List[int] , thrashing_threshold : float , processes : List[ProcessStats]) -> MultiprogramResult :
+    references=sum(process.references for process in processes)
+    page_faults=sum(window_faults)
+    # the last window may be short , ratios use its actual length
+    ratios=[faults / min(window , references - a * window) for a , faults in enumerate(window_faults)]
+    return MultiprogramResult(key , mode , frames , references , page_faults , page_faults / references if references else 0.0 ,
+                              len(ratios) , sum(1 for ratio in ratios if ratio >= thrashing_threshold) , max(ratios , default=0.0) ,
+                              sum(1 for process in processes if process.references and process.fault_ratio >= thrashing_threshold) ,
+                              processes)
+
+def simulate_multiprogram(key : str , workload : Workload , frames : int , mode : str = 'global' , window : int = DEFAULT_WINDOW , thrashing_threshold : float = DEFAULT_THRASHING_THRESHOLD , pff_interval : int = DEFAULT_PFF_INTERVAL) -> MultiprogramResult :
+    if frames <= 0 :
+        raise ValueError(f"Number of frames must be a positive integer : {frames}")
+    if window <= 0 :
+        raise ValueError(f"Window must be a positive integer : {window}")
+    if mode == 'global' :
+        return simulate_global(key , workload , frames , window , thrashing_threshold)
+    return simulate_local(key , workload , frames , mode , window , thrashing_threshold , pff_interval)
+
+def result_dict(result : MultiprogramResult) -> Dict :
+    report=result._asdict()
+    report['processes']=[process._asdict() for process in result.processes]
+    return report
+
+def main(argv : List[str] = None) -> int :
+    import argparse
+    import json
+    import sys
+    from registry import ALGORITHMS,get_algorithm
+    from trace_format import load_trace
+
+    parser=argparse.ArgumentParser(description="Simulate several processes sharing one frame pool , with global or local replacement")
+    parser.add_argument('traces' , nargs='*' , help="one trace file per process (text or binary)")
+    parser.add_argument('--tagged' , help="one trace with `PID PAGE` per line instead of per-process files")
+    parser.add_argument('--algorithms' , nargs='+' , default=['lru'] , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , nargs='+' , type=int , required=True , help="total frames of the host")
+    parser.add_argument('--modes' , nargs='+' , choices=MODES , help="default : all , pff only for fifo , lru and optimal")
+    parser.add_argument('--quantum' , type=int , default=DEFAULT_QUANTUM , help="references per time slice when interleaving trace files")
+    parser.add_argument('--window' , type=int , default=DEFAULT_WINDOW , help="references per thrashing window")
+    parser.add_argument('--thrashing-threshold' , type=float , default=DEFAULT_THRASHING_THRESHOLD)
+    parser.add_argument('--pff-interval' , type=int , default=DEFAULT_PFF_INTERVAL , help="pff : faults closer than this (own references) ask for a frame")
+    parser.add_argument('--summary' , action='store_true' , help="leave out per-process rows")
+    args=parser.parse_args(argv)
+
+    if not args.tagged and not args.traces :
+        parser.error("give per-process trace files or --tagged")
+    fixed_size=[key for key in args.algorithms if not get_algorithm(key).cls.resizable]
+    if args.modes and 'pff' in args.modes and fixed_size :
+        parser.error(f"pff needs fifo , lru or optimal , not {' , '.join(fixed_size)}")
+
+    try :
+        if args.tagged :
+            workload=load_tagged_trace(args.tagged)
+        else :
+            workload=interleave({filename : load_trace(filename) for filename in args.traces} , args.quantum)
+        report=[]
+        for key in args.algorithms :
+            # pff is left out by default for policies that cannot change their frame count
+            modes=args.modes or [mode for mode in MODES if mode != 'pff' or key not in fixed_size]
+            for frames in args.frames :
+                for mode in modes :
+                    entry=result_dict(simulate_multiprogram(key , workload , frames , mode , args.window , args.thrashing_threshold , args.pff_interval))
+                    if args.summary :
+                        del entry['processes']
+                    report.append(entry)
+    except (OSError , ValueError) as e :
+        print(f"error : {e}" , file=sys.stderr)
+        return 1
+
+    print(json.dumps(report , indent=2))
+    return 0
+
+if __name__ == "__main__" :
+    import sys
+    sys.exit(main())
+
+# End of code
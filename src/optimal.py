@@ -1,85 +1,144 @@
 # optimal (OPT/OPR) page replacement algorithm
 
-from typing import List,Set,Tuple
-from utils import Colors,print_algorithm_header
-
-class Optimal :
-    def __init__(self, frames : int) :
-        self.frames=frames
-        self.page_list=[]
-        self.page_set : Set[int] = set()
+import heapq
+from typing import Any,Dict,List,Optional,Tuple
+from base import PageReplacementAlgorithm
+from preprocess import compute_next_use
+
+class Optimal(PageReplacementAlgorithm) :
+    title="Optimal Page Replacement Algorithm"
+    needs_next_use=True
+    collapses_repeats=True
+    collapses_ping_pong=True
+    resizable=True
+
+    def reset(self) -> None :
+        # resident page -> index of its next use , kept in load order for display
+        self.page_list : Dict[int,int] = {}
+        # resident page -> load sequence number , breaks ties between pages never used again
+        self.load_order : Dict[int,int] = {}
+        # max-heap on next use (stored negated) , stale entries are dropped by compaction
+        self.heap : List[Tuple[int,int,int]] = []
+        self.heap_limit=4 * self.frames + 64
+        # compaction passes and the stale entries they dropped (for instrumentation)
+        self.heap_compactions=0
+        self.heap_discarded=0
+        self.load_count=0
+        self.next_use : List[int] = None
+        self.position=0
         self.page_faults=0
-    
-    def print_step(self , reference : int , current_index : int , total_references : int , is_fault : bool , victim_page : int = None) -> None :
-        step_info=f"Step {current_index + 1}/{total_references}"
-        page_info=f"Page: {reference}"
-        status = f"{Colors.RED}FAULT{Colors.RESET}" if is_fault else f"{Colors.GREEN}HIT{Colors.RESET}"
-        
-        frames_display = []
-        for a in range(self.frames):
-            if a < len(self.page_list):
-                frames_display.append(f"[{self.page_list[a]}]")
-            else:
-                frames_display.append(f"[ ]")
-        
-        frames_str = " ".join(frames_display)
-        victim_info = f" (Replaced : {victim_page})" if victim_page is not None else ""
-        
-        print(f"{Colors.CYAN}{step_info:<12}{Colors.RESET} | "
-              f"{Colors.YELLOW}{page_info:<8}{Colors.RESET} | "
-              f"Frames : {frames_str} | "
-              f"Status : {status}{victim_info}")
-
-    def find_farthest_page(self , reference_string : List[int] , current_index : int) -> int :
+        self.references=0
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.page_list)
+
+    def export_state(self) -> Dict[str , Any] :
+        # the next-use array is not saved , prepare() the same reference string before set_state()
+        return {
+            'pages' : [[page , next_index , self.load_order[page]] for page , next_index in self.page_list.items()] ,
+            'load_count' : self.load_count ,
+            'position' : self.position ,
+            # the heap is O(frames) , saved as is so a resumed run compacts at the same points
+            'heap' : [[-neg_next , order , page] for neg_next , order , page in self.heap] ,
+            'heap_compactions' : self.heap_compactions ,
+            'heap_entries_compacted' : self.heap_discarded
+        }
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        self.page_list={page : next_index for page , next_index , _ in state['pages']}
+        self.load_order={page : order for page , _ , order in state['pages']}
+        if 'heap' in state :
+            self.heap=[(-next_index , order , page) for next_index , order , page in state['heap']]
+        else :
+            # older checkpoints : only live entries are rebuilt
+            self.heap=[(-next_index , order , page) for page , next_index , order in state['pages']]
+        heapq.heapify(self.heap)
+        self.load_count=state['load_count']
+        self.position=state['position']
+        self.heap_compactions=state.get('heap_compactions' , 0)
+        self.heap_discarded=state.get('heap_entries_compacted' , 0)
+
+    def check_feed(self , count : Optional[int]) -> None :
+        if self.next_use is None :
+            raise TypeError("Optimal needs the whole reference string : call prepare(reference_string) before feeding pages")
+        if count is not None and self.position + count > len(self.next_use) :
+            raise ValueError(f"Optimal was prepared for {len(self.next_use)} references , cannot feed past it")
+
+    def prepare(self , reference_string : List[int] , next_use : List[int] = None) -> None :
+        # precompute next-use indices for the whole reference string (or reuse a shared array)
+        if next_use is None :
+            if not hasattr(reference_string , '__getitem__') :
+                raise TypeError("Optimal needs the whole reference string (a list) , not a stream")
+            next_use=compute_next_use(reference_string)
+        self.next_use=next_use
+        self.position=0
+
+    def resize_frames(self , frames : int) -> List[int] :
+        # pages used farthest in future go first
+        evicted=[]
+        while len(self.page_list) > frames :
+            victim_page=self.find_farthest_page()
+            del self.page_list[victim_page]
+            del self.load_order[victim_page]
+            evicted.append(victim_page)
+        self.heap_limit=4 * frames + 64
+        return evicted
+
+    def push_page(self , page : int , next_index : int) -> None :
+        heapq.heappush(self.heap , (-next_index , self.load_order[page] , page))
+        if len(self.heap) > self.heap_limit :
+            # drop stale entries so the heap stays proportional to the frame count
+            page_list=self.page_list
+            live=[entry for entry in self.heap if page_list.get(entry[2]) == -entry[0]]
+            self.heap_compactions += 1
+            self.heap_discarded += len(self.heap) - len(live)
+            heapq.heapify(live)
+            self.heap=live
+
+    def engine_counters(self) -> Dict[str , int] :
+        # heap maintenance : a stale entry's next use has already passed while every live one is
+        # still ahead , so victim search pops exactly one entry per eviction and the cost of the
+        # lazy heap is in compaction (one pass over the heap each time it outgrows heap_limit)
+        return {
+            'heap_compactions' : self.heap_compactions ,
+            'heap_entries_compacted' : self.heap_discarded ,
+            'heap_size' : len(self.heap)
+        }
+
+    def find_farthest_page(self) -> int :
         # find's page that will be used farthest in future
-        for page in self.page_list :
-            if page not in reference_string[current_index + 1:]:
-                return page
-        
-        farthest_index=-1
-        farthest_page=self.page_list[0]
-        
-        for page in self.page_list :
-            try :
-                next_index=reference_string.index(page , current_index + 1)
-                if next_index > farthest_index :
-                    farthest_index = next_index
-                    farthest_page = page
-            except ValueError :
+        # (pages never used again first , earliest loaded among them)
+        heap=self.heap
+        page_list=self.page_list
+        while True :
+            neg_next , _ , page=heapq.heappop(heap)
+            if page_list.get(page) == -neg_next :
                 return page
-        
-        return farthest_page
-    
-    def load_page(self , page : int , reference_string : List[int] , current_index : int) -> Tuple[bool, int] :
-        if page in self.page_set :
-            return False , None
-        
-        victim_page=None
-        
+
+    def load_page(self , page : int) -> bool :
+        # processes the reference at self.position of the prepared reference string
+        next_index=self.next_use[self.position]
+        self.position += 1
+
+        if page in self.page_list :
+            self.page_list[page]=next_index
+            self.push_page(page , next_index)
+            return False
+
         if len(self.page_list) >= self.frames :
-            victim_page=self.find_farthest_page(reference_string , current_index)
-            self.page_list.remove(victim_page)
-            self.page_set.remove(victim_page)
-        
-        self.page_list.append(page)
-        self.page_set.add(page)
+            victim_page=self.find_farthest_page()
+            del self.page_list[victim_page]
+            del self.load_order[victim_page]
+            self.last_victim=victim_page
+        else :
+            self.last_victim=None
+
+        self.page_list[page]=next_index
+        self.load_order[page]=self.load_count
+        self.load_count += 1
+        self.push_page(page , next_index)
         self.page_faults += 1
-        
-        return True , victim_page
-    
-    def run(self,reference_string : List[int]) -> int :
-        print_algorithm_header("Optimal Page Replacement Algorithm")
-        
-        self.page_list=[]
-        self.page_set=set()
-        self.page_faults=0
-        
-        total_references=len(reference_string)
-        
-        for a , page in enumerate(reference_string) : 
-            is_fault, victim_page = self.load_page(page, reference_string, a)
-            self.print_step(page, a, total_references, is_fault, victim_page)
-        
-        return self.page_faults
-    
-# End of code
\ No newline at end of file
+
+        return True
+
+# End of code
@@ -0,0 +1,111 @@
+# out-of-core Optimal : next-use positions are computed by a reverse pass over a memory-mapped
+# binary trace and written to a memory-mapped side file , the forward pass then streams the
+# trace and the side file together
+#
+# memory stays proportional to distinct pages (reverse pass) and frames (forward pass , the
+# Optimal heap is compacted) , trace-sized arrays only live in the page cache
+
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from typing import Dict,List,NamedTuple,Sequence
+from fused import simulate_all
+from trace_format import HEADER,MAGIC,convert_text_to_binary,is_binary_trace,load_binary_trace,typecode_for
+
+BLOCK_SIZE=1 << 16
+
+class OutOfCoreResult(NamedTuple) :
+    references : int
+    page_faults : Dict[int , Dict[str , int]]  # frame count -> algorithm key -> page faults
+
+def write_next_use_file(reference_string : Sequence[int] , filename : str , block_size : int = BLOCK_SIZE) -> int :
+    # reverse pass : next_use[a] (len(reference_string) when never used again) as a binary
+    # trace file (see trace_format.py) , filled from the end block by block , returns its length
+    total_references=len(reference_string)
+    # the never-used-again marker is total_references , it must fit too
+    width=4 if total_references < 1 << 32 else 8
+    typecode=typecode_for(width)
+    size=HEADER.size + total_references * width
+
+    with open(filename , 'wb+') as f :
+        f.write(HEADER.pack(MAGIC , width , total_references))
+        f.truncate(size)
+        if not total_references :
+            return 0
+        with mmap.mmap(f.fileno() , size) as mapped :
+            last_seen={}
+            for end in range(total_references , 0 , -block_size) :
+                start=max(0 , end - block_size)
+                pages=reference_string[start:end]
+                block=[total_references] * (end - start)
+                get=last_seen.get
+                for a in range(end - start - 1 , -1 , -1) :
+                    page=pages[a]
+                    block[a]=get(page , total_references)
+                    last_seen[page]=start + a
+                values=array(typecode , block)
+                if sys.byteorder != 'little' :
+                    values.byteswap()
+                mapped[HEADER.size + start * width:HEADER.size + end * width]=values.tobytes()
+            mapped.flush()
+    return total_references
+
+def simulate_out_of_core(trace_filename : str , algorithms : List[str] , frame_counts : List[int] , work_dir : str = None , next_use_filename : str = None) -> OutOfCoreResult :
+    # page faults per frame count and algorithm for a trace that need not fit in memory ,
+    # text traces are first converted to a temporary binary trace in work_dir. the side file
+    # is written to next_use_filename (kept) or a temporary file (removed afterwards)
+    for frames in frame_counts :
+        if frames <= 0 :
+            raise ValueError(f"Number of frames must be a positive integer : {frames}")
+
+    temporary=[]
+    try :
+        if is_binary_trace(trace_filename) :
+            binary_filename=trace_filename
+        else :
+            handle , binary_filename=tempfile.mkstemp(suffix='.prt' , dir=work_dir)
+            os.close(handle)
+            temporary.append(binary_filename)
+            convert_text_to_binary(trace_filename , binary_filename , width=8)
+        if next_use_filename is None :
+            handle , next_use_filename=tempfile.mkstemp(suffix='.next' , dir=work_dir)
+            os.close(handle)
+            temporary.append(next_use_filename)
+
+        trace=load_binary_trace(binary_filename)
+        references=write_next_use_file(trace , next_use_filename)
+        next_use=load_binary_trace(next_use_filename)
+        page_faults={frames : simulate_all(algorithms , trace , frames , next_use=next_use) for frames in frame_counts}
+        # drop the views so the mappings can be closed before the files are removed
+        del trace , next_use
+        return OutOfCoreResult(references , page_faults)
+    finally :
+        for filename in temporary :
+            try :
+                os.remove(filename)
+            except OSError :
+                pass
+
+def main() -> None :
+    import argparse
+    import json
+    from registry import ALGORITHMS
+
+    parser=argparse.ArgumentParser(description="Optimal (and other policies) on traces larger than memory , via a memory-mapped next-use side file")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithms' , nargs='+' , default=['optimal'] , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , nargs='+' , type=int , required=True)
+    parser.add_argument('--work-dir' , help="directory for temporary files (default : system temp)")
+    parser.add_argument('--next-use' , help="keep the next-use side file here")
+    args=parser.parse_args()
+
+    result=simulate_out_of_core(args.trace , args.algorithms , args.frames , args.work_dir , args.next_use)
+    report={'references' : result.references , 'page_faults' : {str(frames) : page_faults for frames , page_faults in result.page_faults.items()}}
+    print(json.dumps(report , indent=2))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
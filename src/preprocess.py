@@ -0,0 +1,88 @@
+# whole-trace preprocessing : next-use , previous-use and reuse-distance arrays
+#
+# uses NumPy (argsort + grouping , no Python loop) when it is installed and the
+# pages are plain integers , otherwise falls back to a single pure-Python pass
+
+from typing import Hashable,List,Optional,Sequence
+
+_numpy=None
+
+def get_numpy() :
+    # import NumPy on first use only , returns None when it is not installed
+    global _numpy
+    if _numpy is None :
+        try :
+            import numpy
+            _numpy=numpy
+        except ImportError :
+            _numpy=False
+    return _numpy or None
+
+def numpy_links(reference_string : Sequence[Hashable]) :
+    # (order , same) where order sorts references by page (stable , so by time within a page)
+    # and same[a] says order[a] and order[a + 1] reference the same page
+    np=get_numpy()
+    if np is None :
+        return None
+    try :
+        pages=np.asarray(reference_string)
+    except (TypeError , ValueError) :
+        return None
+    if pages.ndim != 1 or pages.dtype.kind not in 'iu' :
+        return None
+    order=np.argsort(pages , kind='stable')
+    sorted_pages=pages[order]
+    same=sorted_pages[1:] == sorted_pages[:-1]
+    return np , order , same
+
+def compute_next_use(reference_string : Sequence[Hashable] , use_numpy : Optional[bool] = None) -> List[int] :
+    # next_use[a] is the index of the next reference to the same page
+    # (len(reference_string) when the page is never used again)
+    total_references=len(reference_string)
+    links=numpy_links(reference_string) if use_numpy is not False and total_references else None
+    if links is not None :
+        np , order , same=links
+        next_use=np.full(total_references , total_references , dtype=np.int64)
+        next_use[order[:-1][same]]=order[1:][same]
+        return next_use.tolist()
+
+    next_use=[total_references] * total_references
+    last_seen={}
+    for a in range(total_references - 1 , -1 , -1) :
+        page=reference_string[a]
+        next_use[a]=last_seen.get(page , total_references)
+        last_seen[page]=a
+    return next_use
+
+def compute_prev_use(reference_string : Sequence[Hashable] , use_numpy : Optional[bool] = None) -> List[int] :
+    # prev_use[a] is the index of the previous reference to the same page (-1 for a first reference)
+    total_references=len(reference_string)
+    links=numpy_links(reference_string) if use_numpy is not False and total_references else None
+    if links is not None :
+        np , order , same=links
+        prev_use=np.full(total_references , -1 , dtype=np.int64)
+        prev_use[order[1:][same]]=order[:-1][same]
+        return prev_use.tolist()
+
+    prev_use=[-1] * total_references
+    last_seen={}
+    for a , page in enumerate(reference_string) :
+        prev_use[a]=last_seen.get(page , -1)
+        last_seen[page]=a
+    return prev_use
+
+def compute_reuse_distances(reference_string : Sequence[Hashable] , use_numpy : Optional[bool] = None) -> List[int] :
+    # reuse_distance[a] is the number of references since the previous reference
+    # to the same page (a - prev_use[a]) , -1 for a first reference
+    total_references=len(reference_string)
+    links=numpy_links(reference_string) if use_numpy is not False and total_references else None
+    if links is not None :
+        np , order , same=links
+        distances=np.full(total_references , -1 , dtype=np.int64)
+        distances[order[1:][same]]=order[1:][same] - order[:-1][same]
+        return distances.tolist()
+
+    return [a - previous if previous >= 0 else -1
+            for a , previous in enumerate(compute_prev_use(reference_string , use_numpy=False))]
+
+# End of code
@@ -0,0 +1,47 @@
+# registry of page replacement algorithms , every policy plugs in through PageReplacementAlgorithm
+
+from typing import Dict,List,NamedTuple,Type
+from base import PageReplacementAlgorithm
+from fifo import FIFO
+from lru import LRU
+from optimal import Optimal
+from clock import Clock
+from lfu import LFU
+from arc import ARC
+from twoq import TwoQ
+
+class AlgorithmInfo(NamedTuple) :
+    key : str
+    cls : Type[PageReplacementAlgorithm]
+    name : str
+    short_name : str
+
+ALGORITHMS : Dict[str , AlgorithmInfo]={}
+
+def register_algorithm(key : str , cls : Type[PageReplacementAlgorithm] , name : str , short_name : str = None) -> None :
+    # add (or replace) a policy under `key`
+    if not issubclass(cls , PageReplacementAlgorithm) :
+        raise TypeError(f"{cls.__name__} must derive from PageReplacementAlgorithm")
+    ALGORITHMS[key]=AlgorithmInfo(key , cls , name , short_name or key.upper())
+
+def get_algorithm(key : str) -> AlgorithmInfo :
+    try :
+        return ALGORITHMS[key]
+    except KeyError :
+        raise ValueError(f"Unknown algorithm : {key} (choose from {', '.join(ALGORITHMS)})") from None
+
+def create_algorithm(key : str , frames : int) -> PageReplacementAlgorithm :
+    return get_algorithm(key).cls(frames)
+
+def available_algorithms() -> List[str] :
+    return list(ALGORITHMS)
+
+register_algorithm('fifo' , FIFO , 'FIFO (First-In-First-Out)')
+register_algorithm('lru' , LRU , 'LRU (Least Recently Used)')
+register_algorithm('optimal' , Optimal , 'OPR/OPT (Optimal)' , 'OPTIMAL')
+register_algorithm('clock' , Clock , 'CLOCK (Second-Chance)')
+register_algorithm('lfu' , LFU , 'LFU (Least Frequently Used)')
+register_algorithm('arc' , ARC , 'ARC (Adaptive Replacement Cache)')
+register_algorithm('2q' , TwoQ , '2Q (Two-Queue)')
+
+# End of code
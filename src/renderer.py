@@ -0,0 +1,95 @@
+# buffered , sampled step renderer for large traces
+#
+# lines are collected and written in large blocks instead of one print() per reference ,
+# frame snapshots are only taken for steps that are actually shown
+
+import os
+import sys
+from typing import Iterable,Sequence,TextIO
+from utils import Colors
+
+class StepRenderer :
+    def __init__(self , stream : TextIO = None , every : int = 1 , faults_only : bool = False , max_frames_shown : int = 16 , color : bool = None , buffer_size : int = 1 << 16) :
+        self.stream=stream if stream is not None else sys.stdout
+        # show every Nth step (1 = all) , optionally only page faults
+        self.every=max(1 , every)
+        self.faults_only=faults_only
+        # wider frame sets are collapsed to their first and last few pages
+        self.max_frames_shown=max(2 , max_frames_shown)
+        if color is None :
+            color=hasattr(self.stream , 'isatty') and self.stream.isatty() and 'NO_COLOR' not in os.environ
+        self.color=color
+        self.buffer_size=buffer_size
+        self.buffer=[]
+        self.buffered=0
+        self.lines_written=0
+
+    def paint(self , code : str , text : str) -> str :
+        return f"{code}{text}{Colors.RESET}" if self.color else text
+
+    def format_frames(self , pages : Sequence[int] , frames : int) -> str :
+        # pad to `frames` slots , collapsing before formatting so wide frame sets stay cheap
+        count=len(pages)
+        if frames > self.max_frames_shown :
+            half=self.max_frames_shown // 2
+            shown=list(range(half))
+            shown.append(None)
+            shown.extend(range(frames - half , frames))
+        else :
+            shown=range(frames)
+        cells=[]
+        for a in shown :
+            if a is None :
+                cells.append(f"... {frames - 2 * half} more ...")
+            else :
+                cells.append(f"[{pages[a]}]" if a < count else "[ ]")
+        return " ".join(cells)
+
+    def format_step(self , index : int , total_references , page : int , is_fault : bool , victim : int , pages : Sequence[int] , frames : int) -> str :
+        step_info=f"Step {index + 1}/{total_references}"
+        page_info=f"Page: {page}"
+        status=self.paint(Colors.RED , "FAULT") if is_fault else self.paint(Colors.GREEN , "HIT")
+        victim_info=f" (Replaced : {victim})" if victim is not None else ""
+        return (f"{self.paint(Colors.CYAN , f'{step_info:<12}')} | "
+                f"{self.paint(Colors.YELLOW , f'{page_info:<8}')} | "
+                f"Frames : {self.format_frames(pages , frames)} | "
+                f"Status : {status}{victim_info}")
+
+    def write(self , line : str) -> None :
+        self.buffer.append(line)
+        self.buffered += len(line) + 1
+        self.lines_written += 1
+        if self.buffered >= self.buffer_size :
+            self.flush()
+
+    def flush(self) -> None :
+        if self.buffer :
+            self.buffer.append("")
+            self.stream.write("\n".join(self.buffer))
+            self.buffer=[]
+            self.buffered=0
+        self.stream.flush()
+
+    def render_run(self , algorithm , reference_string : Iterable[int]) -> int :
+        # verbose run of `algorithm` through this renderer , returns total page faults
+        total_references=len(reference_string) if hasattr(reference_string , '__len__') else '?'
+        title=algorithm.title
+        self.write(self.paint(Colors.BOLD + Colors.PURPLE , '-' * 50))
+        self.write(self.paint(Colors.BOLD + Colors.BLUE , f"{title:^50}"))
+        self.write(self.paint(Colors.BOLD + Colors.PURPLE , '-' * 50))
+
+        every=self.every
+        faults_only=self.faults_only
+        frames=algorithm.frames
+        for event in algorithm.steps(reference_string , snapshots=False) :
+            if faults_only and not event.is_fault :
+                continue
+            if every > 1 and event.index % every :
+                continue
+            self.write(self.format_step(event.index , total_references , event.page , event.is_fault ,
+                                        event.victim , algorithm.frame_snapshot() , frames))
+
+        self.flush()
+        return algorithm.page_faults
+
+# End of code
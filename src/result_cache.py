@@ -0,0 +1,117 @@
+# persistent , content-addressed cache of simulation results with size-bounded LRU eviction on disk
+#
+# an entry is keyed by a hash of the trace contents plus the algorithm and frame count ,
+# one small JSON file per entry , its modification time doubles as the LRU timestamp
+
+import hashlib
+import json
+import os
+from array import array
+from typing import Iterable,Optional
+
+DEFAULT_CACHE_DIR=os.path.join(os.path.expanduser('~') , '.cache' , 'page-replacement-cli')
+DEFAULT_MAX_BYTES=64 * 1024 * 1024
+# bump when simulation results for the same inputs could change
+CACHE_VERSION=1
+DIGEST_CHUNK=1 << 16
+
+def trace_digest(reference_string : Iterable[int]) -> str :
+    # sha256 of the page numbers as 8-byte signed integers , so the same trace hashes the
+    # same whether it came from a list , a text file or a memory-mapped binary file
+    digest=hashlib.sha256()
+    chunk=array('q')
+    for page in reference_string :
+        chunk.append(page)
+        if len(chunk) >= DIGEST_CHUNK :
+            digest.update(chunk.tobytes())
+            chunk=array('q')
+    digest.update(chunk.tobytes())
+    return digest.hexdigest()
+
+class ResultCache :
+    def __init__(self , directory : str = DEFAULT_CACHE_DIR , max_bytes : int = DEFAULT_MAX_BYTES) :
+        self.directory=directory
+        self.max_bytes=max_bytes
+        # bytes on disk , counted lazily on the first write
+        self.total_bytes=None
+        self.hits=0
+        self.misses=0
+
+    def entry_path(self , digest : str , algorithm : str , frames : int) -> str :
+        key=hashlib.sha256(f"{CACHE_VERSION}:{digest}:{algorithm}:{frames}".encode()).hexdigest()
+        return os.path.join(self.directory , key[:2] , key + '.json')
+
+    def get(self , digest : str , algorithm : str , frames : int) -> Optional[int] :
+        # cached page-fault count , or None
+        path=self.entry_path(digest , algorithm , frames)
+        try :
+            with open(path , 'r') as f :
+                entry=json.load(f)
+            # touch , so the entry counts as recently used
+            os.utime(path)
+        except (OSError , ValueError) :
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['page_faults']
+
+    def put(self , digest : str , algorithm : str , frames : int , page_faults : int) -> None :
+        path=self.entry_path(digest , algorithm , frames)
+        os.makedirs(os.path.dirname(path) , exist_ok=True)
+        data=json.dumps({'trace' : digest , 'algorithm' : algorithm , 'frames' : frames , 'page_faults' : page_faults})
+        # write then rename , so concurrent readers never see a partial entry
+        temp_path=f"{path}.{os.getpid()}.tmp"
+        with open(temp_path , 'w') as f :
+            f.write(data)
+        try :
+            previous=os.path.getsize(path)
+        except OSError :
+            previous=0
+        os.replace(temp_path , path)
+
+        if self.total_bytes is None :
+            self.total_bytes=self.disk_usage()
+        else :
+            self.total_bytes += len(data) - previous
+        if self.total_bytes > self.max_bytes :
+            self.evict()
+
+    def entries(self) :
+        # (mtime , size , path) for every entry
+        for root , _ , files in os.walk(self.directory) :
+            for name in files :
+                if name.endswith('.json') :
+                    path=os.path.join(root , name)
+                    try :
+                        stat=os.stat(path)
+                    except OSError :
+                        continue
+                    yield stat.st_mtime , stat.st_size , path
+
+    def disk_usage(self) -> int :
+        return sum(size for _ , size , _ in self.entries())
+
+    def evict(self) -> None :
+        # drop least recently used entries until the cache is back under 90% of its budget
+        entries=sorted(self.entries())
+        total=sum(size for _ , size , _ in entries)
+        target=self.max_bytes * 0.9
+        for _ , size , path in entries :
+            if total <= target :
+                break
+            try :
+                os.remove(path)
+                total -= size
+            except OSError :
+                pass
+        self.total_bytes=total
+
+    def clear(self) -> None :
+        for _ , _ , path in list(self.entries()) :
+            try :
+                os.remove(path)
+            except OSError :
+                pass
+        self.total_bytes=0
+
+# End of code
@@ -0,0 +1,97 @@
+# single-pass stack-distance (Mattson) fault curves for LRU and OPT
+
+from typing import List
+from preprocess import compute_next_use,compute_prev_use
+
+def faults_from_histogram(histogram : List[int] , total_references : int , max_frames : int) -> List[int] :
+    # faults[k-1] is the number of references whose stack distance exceeds k
+    faults=[]
+    hits=0
+    for k in range(1 , max_frames + 1) :
+        hits += histogram[k]
+        faults.append(total_references - hits)
+    return faults
+
+def lru_fault_curve(reference_string : List[int] , max_frames : int) -> List[int] :
+    # LRU faults for frames 1..max_frames from one pass
+    # a Fenwick tree marks the last access time of every page , so the number of
+    # distinct pages touched since the previous access is a prefix-sum difference
+    total_references=len(reference_string)
+    tree=[0] * (total_references + 1)
+    histogram=[0] * (max_frames + 1)
+    prev_use=compute_prev_use(reference_string)
+
+    for a in range(total_references) :
+        previous=prev_use[a]
+        if previous >= 0 :
+            # distinct pages referenced in (previous, a) = marks in positions previous+1 .. a-1
+            distance=1
+            b=a
+            while b > 0 :
+                distance += tree[b]
+                b -= b & -b
+            b=previous + 1
+            while b > 0 :
+                distance -= tree[b]
+                b -= b & -b
+            if distance <= max_frames :
+                histogram[distance] += 1
+            b=previous + 1
+            while b <= total_references :
+                tree[b] -= 1
+                b += b & -b
+        b=a + 1
+        while b <= total_references :
+            tree[b] += 1
+            b += b & -b
+
+    return faults_from_histogram(histogram , total_references , max_frames)
+
+def opt_fault_curve(reference_string : List[int] , max_frames : int) -> List[int] :
+    # OPT faults for frames 1..max_frames from one pass over the OPT priority stack
+    # (the page referenced soonest has the highest priority) , only the top
+    # max_frames entries are kept since deeper pages never move up except when referenced
+    next_use=compute_next_use(reference_string)
+    total_references=len(reference_string)
+    histogram=[0] * (max_frames + 1)
+    priority={}
+    stack=[]
+
+    for a , page in enumerate(reference_string) :
+        priority[page]=next_use[a]
+        try :
+            depth=stack.index(page)
+            histogram[depth + 1] += 1
+        except ValueError :
+            depth=len(stack)
+
+        if not stack :
+            stack.append(page)
+            continue
+        if depth == 0 :
+            continue
+
+        # push the page on top and carry the displaced entries down to the hole it left
+        carried=stack[0]
+        stack[0]=page
+        for b in range(1 , depth) :
+            resident=stack[b]
+            if priority[resident] > priority[carried] :
+                stack[b]=carried
+                carried=resident
+        if depth < len(stack) :
+            stack[depth]=carried
+        elif len(stack) < max_frames :
+            stack.append(carried)
+
+    return faults_from_histogram(histogram , total_references , max_frames)
+
+def fault_curve(algorithm : str , reference_string : List[int] , max_frames : int) -> List[int] :
+    # fault counts for frames 1..max_frames ('lru' or 'optimal')
+    if algorithm == 'lru' :
+        return lru_fault_curve(reference_string , max_frames)
+    if algorithm == 'optimal' :
+        return opt_fault_curve(reference_string , max_frames)
+    raise ValueError(f"No stack-distance curve for algorithm : {algorithm}")
+
+# End of code
@@ -0,0 +1,138 @@
+# parallel parameter sweep : algorithms x frame counts x trace files over a process pool
+
+import os
+from typing import TYPE_CHECKING,Dict,List,NamedTuple,Optional,Sequence,Tuple
+from fused import simulate_all
+from registry import ALGORITHMS,get_algorithm
+from trace_format import load_trace
+
+if TYPE_CHECKING :
+    # the cache (hashlib , json) is only imported when a sweep uses one
+    from result_cache import ResultCache
+
+class SweepResult(NamedTuple) :
+    trace : str
+    algorithm : str
+    frames : int
+    page_faults : int
+    references : int
+
+# traces loaded by this process , keyed by filename (binary traces are memory-mapped ,
+# so every worker shares the same page cache instead of receiving pickled copies)
+_loaded_traces : Dict[str , Sequence[int]] = {}
+
+def get_trace(filename : str) -> Sequence[int] :
+    trace=_loaded_traces.get(filename)
+    if trace is None :
+        trace=_loaded_traces[filename]=load_trace(filename)
+    return trace
+
+def run_task(task : Tuple[str , Tuple[str , ...] , int]) -> List[SweepResult] :
+    # every algorithm for one (trace , frames) pair in a single fused pass ,
+    # tasks only carry the trace filename
+    filename , algorithms , frames=task
+    trace=get_trace(filename)
+    page_faults=simulate_all(list(algorithms) , trace , frames)
+    return [SweepResult(filename , algorithm , frames , page_faults[algorithm] , len(trace))
+            for algorithm in algorithms]
+
+def run_sweep(trace_files : List[str] , algorithms : List[str] , frame_counts : List[int] , workers : Optional[int] = None , cache : Optional['ResultCache'] = None) -> List[SweepResult] :
+    # simulate every combination , spread over `workers` processes (all cores by default) ,
+    # combinations already in `cache` are not simulated again
+    for algorithm in algorithms :
+        get_algorithm(algorithm)
+    for frames in frame_counts :
+        if frames <= 0 :
+            raise ValueError(f"Number of frames must be a positive integer : {frames}")
+
+    if cache is None :
+        tasks=[(filename , tuple(algorithms) , frames)
+               for filename in trace_files
+               for frames in frame_counts]
+        results=[]
+    else :
+        tasks , results , digests=lookup_cached(cache , trace_files , algorithms , frame_counts)
+
+    if workers is None :
+        workers=os.cpu_count() or 1
+    workers=min(workers , len(tasks))
+
+    if not tasks :
+        batches=[]
+    elif workers <= 1 :
+        batches=[run_task(task) for task in tasks]
+    else :
+        # imported here , the process pool machinery is slow to import and not needed serially
+        from concurrent.futures import ProcessPoolExecutor
+        # tasks for the same trace are adjacent , so chunks mostly reuse a worker's loaded trace
+        chunksize=max(1 , len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool :
+            batches=list(pool.map(run_task , tasks , chunksize=chunksize))
+
+    for batch in batches :
+        for result in batch :
+            if cache is not None :
+                cache.put(digests[result.trace] , result.algorithm , result.frames , result.page_faults)
+            results.append(result)
+
+    # one row per trace , algorithm and frame count in that order
+    trace_order={filename : a for a , filename in reversed(list(enumerate(trace_files)))}
+    algorithm_order={algorithm : a for a , algorithm in enumerate(algorithms)}
+    frame_order={frames : a for a , frames in enumerate(frame_counts)}
+    results.sort(key=lambda result : (trace_order[result.trace] , algorithm_order[result.algorithm] , frame_order[result.frames]))
+    return results
+
+def lookup_cached(cache : 'ResultCache' , trace_files : List[str] , algorithms : List[str] , frame_counts : List[int]) :
+    # split the sweep into cached results and the tasks still to simulate
+    from result_cache import trace_digest
+    tasks=[]
+    results=[]
+    digests={}
+    for filename in trace_files :
+        if filename in digests :
+            continue
+        trace=get_trace(filename)
+        digest=digests[filename]=trace_digest(trace)
+        for frames in frame_counts :
+            missing=[]
+            for algorithm in algorithms :
+                page_faults=cache.get(digest , algorithm , frames)
+                if page_faults is None :
+                    missing.append(algorithm)
+                else :
+                    results.append(SweepResult(filename , algorithm , frames , page_faults , len(trace)))
+            if missing :
+                tasks.append((filename , tuple(missing) , frames))
+    return tasks , results , digests
+
+def format_sweep_table(results : List[SweepResult]) -> str :
+    # plain-text table , one row per simulation
+    lines=[f"{'Trace':<30} {'Algorithm':<10} {'Frames':>8} {'Page Faults':>12} {'Fault Ratio':>12}" ,
+           "-" * 76]
+    for result in results :
+        ratio=result.page_faults / result.references if result.references else 0
+        lines.append(f"{os.path.basename(result.trace):<30} {result.algorithm:<10} {result.frames:>8} "
+                     f"{result.page_faults:>12} {ratio:>12.2%}")
+    return "\n".join(lines)
+
+def main() -> None :
+    import argparse
+    parser=argparse.ArgumentParser(description="Run page replacement simulations for every trace x algorithm x frame count")
+    parser.add_argument('traces' , nargs='+' , help="text or binary trace files")
+    parser.add_argument('--algorithms' , nargs='+' , default=list(ALGORITHMS) , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , nargs='+' , type=int , required=True , help="frame counts to simulate")
+    parser.add_argument('--workers' , type=int , default=None , help="worker processes (default : all cores)")
+    parser.add_argument('--cache-dir' , help="reuse and store results in this result cache directory")
+    args=parser.parse_args()
+
+    cache=None
+    if args.cache_dir :
+        from result_cache import ResultCache
+        cache=ResultCache(args.cache_dir)
+    results=run_sweep(args.traces , args.algorithms , args.frames , args.workers , cache)
+    print(format_sweep_table(results))
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
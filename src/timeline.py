@@ -0,0 +1,108 @@
+# phase behaviour over time : sliding-window fault rate and Denning working-set size W(t , delta)
+#
+# both are maintained incrementally in one pass (O(1) amortized per reference) :
+# a ring of fault bits keeps the window's fault count , a ring of the last `delta` pages plus
+# each page's last reference time keeps the set of distinct pages referenced in (t - delta , t]
+
+import json
+from typing import Iterable,Iterator,List,NamedTuple
+from base import PageReplacementAlgorithm
+
+class TimelinePoint(NamedTuple) :
+    references : int      # references processed so far (end of the window)
+    window_faults : int   # page faults among the last `window` references
+    fault_rate : float
+    working_set : int     # distinct pages among the last `delta` references
+
+def iter_timeline(algorithm : PageReplacementAlgorithm , reference_string : Iterable[int] , window : int , delta : int = None , step : int = None) -> Iterator[TimelinePoint] :
+    # one point every `step` references (default : every `window`) plus one at the end of the trace ,
+    # delta defaults to the window length
+    delta=delta or window
+    step=step or window
+    for name , value in (('window' , window) , ('delta' , delta) , ('step' , step)) :
+        if value <= 0 :
+            raise ValueError(f"{name.capitalize()} must be a positive integer : {value}")
+
+    algorithm.reset()
+    algorithm.prepare(reference_string)
+    load_page=algorithm.load_page
+
+    fault_bits=bytearray(window)
+    window_faults=0
+    recent=[None] * delta
+    # page -> last reference time , only for pages referenced within the last delta references
+    last_seen={}
+    t=-1
+
+    for t , page in enumerate(reference_string) :
+        is_fault=load_page(page)
+        slot=t % window
+        window_faults += is_fault - fault_bits[slot]
+        fault_bits[slot]=is_fault
+
+        slot=t % delta
+        if t >= delta :
+            # reference t - delta leaves the working-set window
+            old_page=recent[slot]
+            if last_seen[old_page] == t - delta :
+                del last_seen[old_page]
+        recent[slot]=page
+        last_seen[page]=t
+
+        if (t + 1) % step == 0 :
+            yield TimelinePoint(t + 1 , window_faults , window_faults / min(t + 1 , window) , len(last_seen))
+
+    references=t + 1
+    algorithm.references=references
+    if references % step :
+        yield TimelinePoint(references , window_faults , window_faults / min(references , window) , len(last_seen))
+
+def compute_timeline(algorithm : PageReplacementAlgorithm , reference_string : Iterable[int] , window : int , delta : int = None , step : int = None) -> List[TimelinePoint] :
+    return list(iter_timeline(algorithm , reference_string , window , delta , step))
+
+def format_timeline_csv(points : Iterable[TimelinePoint]) -> str :
+    lines=[",".join(TimelinePoint._fields)]
+    lines.extend(f"{point.references},{point.window_faults},{point.fault_rate:.6f},{point.working_set}" for point in points)
+    return "\n".join(lines)
+
+def format_timeline_json(points : Iterable[TimelinePoint]) -> str :
+    # column-oriented , so long timelines stay compact and load straight into plotting tools
+    points=list(points)
+    columns={field : [getattr(point , field) for point in points] for field in TimelinePoint._fields}
+    return json.dumps(columns , separators=(',' , ':'))
+
+def main() -> None :
+    import argparse
+    from registry import ALGORITHMS,create_algorithm
+    from trace_format import is_binary_trace,load_trace
+    from utils import iter_reference_file
+
+    parser=argparse.ArgumentParser(description="Windowed fault rate and working-set size over a trace")
+    parser.add_argument('trace' , help="text or binary trace file")
+    parser.add_argument('--algorithm' , default='lru' , choices=list(ALGORITHMS))
+    parser.add_argument('--frames' , type=int , required=True)
+    parser.add_argument('--window' , type=int , default=10000 , help="references per fault-rate window")
+    parser.add_argument('--delta' , type=int , default=None , help="working-set window (default : --window)")
+    parser.add_argument('--step' , type=int , default=None , help="references between points (default : --window)")
+    parser.add_argument('--format' , choices=['csv' , 'json'] , default='csv')
+    parser.add_argument('--output' , help="write here instead of stdout")
+    args=parser.parse_args()
+
+    algorithm=create_algorithm(args.algorithm , args.frames)
+    if algorithm.needs_next_use or is_binary_trace(args.trace) :
+        trace=load_trace(args.trace)
+    else :
+        trace=iter_reference_file(args.trace)
+    points=iter_timeline(algorithm , trace , args.window , args.delta , args.step)
+    text=format_timeline_csv(points) if args.format == 'csv' else format_timeline_json(points)
+
+    if args.output :
+        with open(args.output , 'w') as f :
+            f.write(text + "\n")
+    else :
+        print(text)
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
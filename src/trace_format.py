@@ -0,0 +1,114 @@
+# compact binary trace format (fixed-width unsigned page numbers with a small header)
+#
+# layout : 16-byte header followed by the page numbers , little endian
+#   magic     4 bytes   b'PRT1'
+#   width     1 byte    bytes per page number (4 or 8)
+#   reserved  3 bytes
+#   count     8 bytes   number of references
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable,List,Sequence,Union
+from utils import iter_reference_file
+
+MAGIC=b'PRT1'
+HEADER=struct.Struct('<4sB3xQ')
+TYPECODES={4 : 'I' , 8 : 'Q'}
+BATCH_SIZE=1 << 16
+
+def typecode_for(width : int) -> str :
+    # array typecode with exactly `width` bytes per item
+    if width not in TYPECODES :
+        raise ValueError(f"Unsupported page width : {width} (use 4 or 8)")
+    typecode=TYPECODES[width]
+    if array(typecode).itemsize != width :
+        typecode='L' if array('L').itemsize == width else None
+    if typecode is None :
+        raise ValueError(f"No {width}-byte unsigned array type on this platform")
+    return typecode
+
+def write_batch(f , batch : array) -> None :
+    if sys.byteorder != 'little' :
+        batch.byteswap()
+    batch.tofile(f)
+
+def write_binary_trace(reference_string : Iterable[int] , filename : str , width : int = 4) -> int :
+    # write's page numbers to a binary trace file , returns the number of references written
+    typecode=typecode_for(width)
+    count=0
+    with open(filename , 'wb') as f :
+        f.write(HEADER.pack(MAGIC , width , 0))
+        batch=array(typecode)
+        try :
+            for page in reference_string :
+                batch.append(page)
+                if len(batch) >= BATCH_SIZE :
+                    count += len(batch)
+                    write_batch(f , batch)
+                    batch=array(typecode)
+        except OverflowError :
+            raise ValueError(f"Page number out of range for {width}-byte unsigned trace : {page}")
+        count += len(batch)
+        write_batch(f , batch)
+        # patch the reference count now that it is known
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC , width , count))
+    return count
+
+def convert_text_to_binary(text_filename : str , binary_filename : str , width : int = 4) -> int :
+    # stream's a whitespace-separated trace into the binary format
+    return write_binary_trace(iter_reference_file(text_filename) , binary_filename , width)
+
+def is_binary_trace(filename : str) -> bool :
+    with open(filename , 'rb') as f :
+        return f.read(len(MAGIC)) == MAGIC
+
+def load_binary_trace(filename : str) -> Sequence[int] :
+    # memory-map a binary trace , the returned memoryview indexes pages without copying them
+    with open(filename , 'rb') as f :
+        header=f.read(HEADER.size)
+        if len(header) < HEADER.size :
+            raise ValueError(f"{filename} is too short to be a binary trace")
+        magic , width , count=HEADER.unpack(header)
+        if magic != MAGIC :
+            raise ValueError(f"{filename} is not a binary trace")
+        typecode=typecode_for(width)
+        end=HEADER.size + count * width
+        mapped=mmap.mmap(f.fileno() , 0 , access=mmap.ACCESS_READ)
+
+    if len(mapped) < end :
+        mapped.close()
+        raise ValueError(f"{filename} is truncated ({count} references expected)")
+
+    if sys.byteorder != 'little' :
+        # big-endian hosts need a swapped copy
+        pages=array(typecode , mapped[HEADER.size:end])
+        pages.byteswap()
+        mapped.close()
+        return pages
+
+    return memoryview(mapped)[HEADER.size:end].cast(typecode)
+
+def load_trace(filename : str) -> Union[Sequence[int] , List[int]] :
+    # binary traces are memory-mapped , text traces are parsed into a list
+    if is_binary_trace(filename) :
+        return load_binary_trace(filename)
+    return list(iter_reference_file(filename))
+
+def main() -> None :
+    import argparse
+    parser=argparse.ArgumentParser(description="Convert a whitespace-separated reference string to the binary trace format")
+    parser.add_argument('input' , help="text trace (space/newline separated page numbers)")
+    parser.add_argument('output' , help="binary trace file to write")
+    parser.add_argument('--width' , type=int , choices=sorted(TYPECODES) , default=4 , help="bytes per page number")
+    args=parser.parse_args()
+
+    count=convert_text_to_binary(args.input , args.output , args.width)
+    print(f"Wrote {count} references to {args.output}")
+
+if __name__ == "__main__" :
+    main()
+
+# End of code
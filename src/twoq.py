@@ -0,0 +1,63 @@
+# 2Q page replacement algorithm (Johnson & Shasha , full version)
+
+from collections import OrderedDict
+from typing import Any,Dict,Tuple
+from base import PageReplacementAlgorithm
+
+class TwoQ(PageReplacementAlgorithm) :
+    title="2Q Page Replacement Algorithm"
+    collapses_repeats=True
+
+    def reset(self) -> None :
+        # a1in : FIFO of pages seen once    am : LRU of pages seen again
+        # a1out : ghost FIFO of pages evicted from a1in (no frames used)
+        self.a1in=OrderedDict()
+        self.a1out=OrderedDict()
+        self.am=OrderedDict()
+        self.in_size=max(1 , self.frames // 4)
+        self.out_size=max(1 , self.frames // 2)
+        self.page_faults=0
+        self.references=0
+
+    def frame_snapshot(self) -> Tuple[int, ...] :
+        return tuple(self.a1in) + tuple(self.am)
+
+    def export_state(self) -> Dict[str , Any] :
+        return {'a1in' : list(self.a1in) , 'a1out' : list(self.a1out) , 'am' : list(self.am)}
+
+    def import_state(self , state : Dict[str , Any]) -> None :
+        self.a1in=OrderedDict.fromkeys(state['a1in'])
+        self.a1out=OrderedDict.fromkeys(state['a1out'])
+        self.am=OrderedDict.fromkeys(state['am'])
+
+    def reclaim(self) -> None :
+        # free one frame if memory is full
+        if len(self.a1in) + len(self.am) < self.frames :
+            self.last_victim=None
+        elif len(self.a1in) > self.in_size or not self.am :
+            self.last_victim , _=self.a1in.popitem(last=False)
+            self.a1out[self.last_victim]=None
+            if len(self.a1out) > self.out_size :
+                self.a1out.popitem(last=False)
+        else :
+            self.last_victim , _=self.am.popitem(last=False)
+
+    def load_page(self , page : int) -> bool :
+        if page in self.am :
+            self.am.move_to_end(page)
+            return False
+        if page in self.a1in :
+            # correlated references while on probation do not promote the page
+            return False
+
+        self.reclaim()
+        if page in self.a1out :
+            del self.a1out[page]
+            self.am[page]=None
+        else :
+            self.a1in[page]=None
+
+        self.page_faults += 1
+        return True
+
+# End of code
@@ -3,7 +3,7 @@
 import os
 import sys
 import time
-from typing import List
+from typing import Iterator,List
 
 class Colors :
     # ANSI color codes for terminal output
@@ -108,13 +108,30 @@ def save_results_to_file(results : str , filename : str = None) -> bool :
 def load_reference_string_from_file(filename : str) -> List[int] :
     # load's reference string from a file
     try :
-        with open(filename , 'r') as f :
-            content=f.read().strip()
-            return list(map(int, content.split()))
+        return list(iter_reference_file(filename))
     except Exception as e :
         print_error(f"Failed to load file : {e}")
         return []
 
+def iter_reference_file(filename : str , chunk_size : int = 1 << 20) -> Iterator[int] :
+    # stream's page numbers from a whitespace-separated file in fixed-size chunks
+    # (a number split across two chunks is carried over , memory stays at one chunk)
+    with open(filename , 'r') as f :
+        tail=''
+        while True :
+            chunk=f.read(chunk_size)
+            if not chunk :
+                break
+            chunk=tail + chunk
+            tokens=chunk.split()
+            if tokens and not chunk[-1].isspace() :
+                tail=tokens.pop()
+            else :
+                tail=''
+            yield from map(int , tokens)
+        if tail :
+            yield int(tail)
+
 def generate_sample_reference_string(length : int = 20 , max_page : int = 10) -> List[int] :
     # generate's a sample reference string for testing
     import random
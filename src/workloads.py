@@ -0,0 +1,74 @@
+# seeded synthetic workload generators that look more like real memory access than uniform random
+
+import random
+from itertools import accumulate
+from typing import Callable,Dict,List
+
+def zipf_workload(length : int , pages : int = 10000 , alpha : float = 1.0 , seed : int = 0) -> List[int] :
+    # popularity follows a Zipf law : page of rank r is referenced with weight 1 / r^alpha
+    rng=random.Random(seed)
+    cum_weights=list(accumulate(1.0 / (rank ** alpha) for rank in range(1 , pages + 1)))
+    ranks=rng.choices(range(pages) , cum_weights=cum_weights , k=length)
+    # shuffle which page gets which rank so hot pages are not simply 0 , 1 , 2 ...
+    page_ids=list(range(pages))
+    rng.shuffle(page_ids)
+    return [page_ids[rank] for rank in ranks]
+
+def loop_workload(length : int , loop_size : int = 1000 , noise : float = 0.01 , seed : int = 0) -> List[int] :
+    # sequential scan over loop_size pages , repeated , with a small fraction of random references
+    rng=random.Random(seed)
+    trace=[a % loop_size for a in range(length)]
+    for a in range(length) :
+        if rng.random() < noise :
+            trace[a]=rng.randrange(loop_size * 10)
+    return trace
+
+def phase_workload(length : int , working_set : int = 500 , phases : int = 10 , pages : int = 100000 , locality : float = 0.95 , seed : int = 0) -> List[int] :
+    # program phases : each phase mostly references its own working set , which moves between phases
+    rng=random.Random(seed)
+    phase_length=max(1 , length // phases)
+    trace=[]
+    while len(trace) < length :
+        base=rng.randrange(max(1 , pages - working_set))
+        for _ in range(min(phase_length , length - len(trace))) :
+            if rng.random() < locality :
+                trace.append(base + rng.randrange(working_set))
+            else :
+                trace.append(rng.randrange(pages))
+    return trace
+
+def mixed_workload(length : int , seed : int = 0) -> List[int] :
+    # interleaved bursts of Zipfian , scanning and phase behaviour over disjoint page ranges :
+    # zipf [0 , 5000) , loop [10000 , 30000) (its noise reaches 10 x loop_size) , phase [30000 , 80000)
+    rng=random.Random(seed)
+    loop_size=2000
+    loop_offset=10000
+    phase_offset=loop_offset + loop_size * 10
+    sources=[
+        zipf_workload(length , pages=5000 , seed=seed + 1) ,
+        [page + loop_offset for page in loop_workload(length , loop_size=loop_size , seed=seed + 2)] ,
+        [page + phase_offset for page in phase_workload(length , pages=50000 , seed=seed + 3)]
+    ]
+    positions=[0 , 0 , 0]
+    trace=[]
+    while len(trace) < length :
+        source=rng.randrange(len(sources))
+        burst=min(rng.randint(1 , 200) , length - len(trace))
+        start=positions[source]
+        trace.extend(sources[source][start:start + burst])
+        positions[source]=start + burst
+    return trace
+
+WORKLOADS : Dict[str , Callable[... , List[int]]]={
+    'zipf' : zipf_workload ,
+    'loop' : loop_workload ,
+    'phase' : phase_workload ,
+    'mixed' : mixed_workload
+}
+
+def generate_workload(name : str , length : int , seed : int = 0) -> List[int] :
+    if name not in WORKLOADS :
+        raise ValueError(f"Unknown workload : {name} (choose from {', '.join(WORKLOADS)})")
+    return WORKLOADS[name](length , seed=seed)
+
+# End of code
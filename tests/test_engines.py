@@ -0,0 +1,198 @@
+# regression checks : the optimized engines against the original list-based implementations
+#
+# run from the repository root with `python -m unittest discover -s tests` (or pytest)
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+from typing import List,Optional,Tuple
+
+sys.path.insert(0 , os.path.join(os.path.dirname(os.path.abspath(__file__)) , '..' , 'src'))
+
+from checkpoint import replay,save_checkpoint
+from compaction import CompactedTrace,compact_trace,simulate_compacted
+from fifo import FIFO
+from lru import LRU
+from optimal import Optimal
+from out_of_core import simulate_out_of_core
+from registry import ALGORITHMS,create_algorithm
+from stack_distance import lru_fault_curve,opt_fault_curve
+from trace_format import write_binary_trace
+from workloads import loop_workload,phase_workload,zipf_workload
+
+# the original engines' load_page logic without the printing , one (is_fault , victim) per reference
+
+def baseline_fifo(reference_string : List[int] , frames : int) -> List[Tuple[bool , Optional[int]]] :
+    queue=[]
+    steps=[]
+    for page in reference_string :
+        if page in queue :
+            steps.append((False , None))
+            continue
+        victim=queue.pop(0) if len(queue) >= frames else None
+        queue.append(page)
+        steps.append((True , victim))
+    return steps
+
+def baseline_lru(reference_string : List[int] , frames : int) -> List[Tuple[bool , Optional[int]]] :
+    page_list=[]
+    steps=[]
+    for page in reference_string :
+        if page in page_list :
+            page_list.remove(page)
+            page_list.append(page)
+            steps.append((False , None))
+            continue
+        victim=page_list.pop(0) if len(page_list) >= frames else None
+        page_list.append(page)
+        steps.append((True , victim))
+    return steps
+
+def baseline_optimal(reference_string : List[int] , frames : int) -> List[Tuple[bool , Optional[int]]] :
+    page_list=[]
+    steps=[]
+    for a , page in enumerate(reference_string) :
+        if page in page_list :
+            steps.append((False , None))
+            continue
+        victim=None
+        if len(page_list) >= frames :
+            # first page (in load order) never used again , otherwise the one used farthest ahead
+            future=reference_string[a + 1:]
+            unused=[resident for resident in page_list if resident not in future]
+            victim=unused[0] if unused else max(page_list , key=future.index)
+            page_list.remove(victim)
+        page_list.append(page)
+        steps.append((True , victim))
+    return steps
+
+BASELINES={'fifo' : (FIFO , baseline_fifo) , 'lru' : (LRU , baseline_lru) , 'optimal' : (Optimal , baseline_optimal)}
+
+def random_traces(count : int , seed : int = 0) -> List[List[int]] :
+    # short traces over small page sets , so every frame count sees plenty of evictions
+    rng=random.Random(seed)
+    return [[rng.randrange(rng.randint(1 , 12)) for _ in range(rng.randint(0 , 120))] for _ in range(count)]
+
+def workload_traces() -> List[List[int]] :
+    return [zipf_workload(3000 , pages=200 , seed=1) ,
+            loop_workload(3000 , loop_size=40 , seed=2) ,
+            phase_workload(3000 , working_set=30 , phases=4 , pages=500 , seed=3) ,
+            [1 , 2 , 3 , 4 , 1 , 2 , 5 , 1 , 2 , 3 , 4 , 5]]
+
+class BaselineEquivalenceTest(unittest.TestCase) :
+    def check_steps(self , key : str , reference_string : List[int] , frames : int) -> None :
+        cls , baseline=BASELINES[key]
+        expected=baseline(reference_string , frames)
+        got=[(event.is_fault , event.victim) for event in cls(frames).steps(reference_string , snapshots=False)]
+        self.assertEqual(got , expected , f"{key} with {frames} frames on {reference_string}")
+        self.assertEqual(cls(frames).simulate(reference_string) , sum(is_fault for is_fault , _ in expected))
+
+    def test_faults_and_victims_random(self) -> None :
+        for key in BASELINES :
+            for reference_string in random_traces(200) :
+                for frames in (1 , 2 , 3 , 5 , 8) :
+                    self.check_steps(key , reference_string , frames)
+
+    def test_faults_and_victims_workloads(self) -> None :
+        for key in BASELINES :
+            for reference_string in workload_traces() :
+                for frames in (1 , 4 , 16 , 64) :
+                    self.check_steps(key , reference_string , frames)
+
+    def test_belady_anomaly(self) -> None :
+        reference_string=[1 , 2 , 3 , 4 , 1 , 2 , 5 , 1 , 2 , 3 , 4 , 5]
+        self.assertEqual(FIFO(3).simulate(reference_string) , 9)
+        self.assertEqual(FIFO(4).simulate(reference_string) , 10)
+
+class FaultCurveTest(unittest.TestCase) :
+    def check_curves(self , reference_string : List[int] , max_frames : int) -> None :
+        for curve , cls in ((lru_fault_curve , LRU) , (opt_fault_curve , Optimal)) :
+            expected=[cls(frames).simulate(reference_string) for frames in range(1 , max_frames + 1)]
+            self.assertEqual(curve(reference_string , max_frames) , expected , f"{cls.__name__} curve on {reference_string}")
+
+    def test_random(self) -> None :
+        for reference_string in random_traces(100 , seed=1) :
+            self.check_curves(reference_string , 10)
+
+    def test_workloads(self) -> None :
+        for reference_string in workload_traces() :
+            self.check_curves(reference_string , 48)
+
+class RegistryTest(unittest.TestCase) :
+    def test_policy_invariants(self) -> None :
+        # no policy beats Optimal or misses a compulsory fault , and none holds more than its frames
+        for reference_string in random_traces(100 , seed=3) + workload_traces() :
+            for frames in (1 , 2 , 4 , 16) :
+                lower_bound=max(Optimal(frames).simulate(reference_string) , len(set(reference_string)))
+                for key in ALGORITHMS :
+                    faults=create_algorithm(key , frames).simulate(reference_string)
+                    self.assertGreaterEqual(faults , lower_bound , f"{key} with {frames} frames on {reference_string}")
+                    events=list(create_algorithm(key , frames).steps(reference_string))
+                    self.assertEqual(sum(event.is_fault for event in events) , faults)
+                    self.assertTrue(all(len(event.frames) <= frames for event in events))
+
+class CompactionTest(unittest.TestCase) :
+    def test_totals_match_simulate(self) -> None :
+        for reference_string in random_traces(150 , seed=2) + workload_traces() :
+            trace=CompactedTrace(reference_string)
+            for key in ALGORITHMS :
+                for frames in (1 , 2 , 3 , 8) :
+                    expected=create_algorithm(key , frames).simulate(reference_string)
+                    result=simulate_compacted(create_algorithm(key , frames) , trace)
+                    self.assertEqual(result.page_faults , expected , f"{key} with {frames} frames on {reference_string}")
+                    self.assertEqual(result.hits , len(reference_string) - expected)
+
+    def test_ping_pong_form(self) -> None :
+        self.assertEqual(compact_trace([1 , 1 , 2 , 2 , 2 , 3]) , [1 , 2 , 3])
+        self.assertEqual(compact_trace([1 , 2 , 1 , 2 , 1 , 2 , 1 , 3] , ping_pong=True) , [1 , 2 , 1 , 3])
+
+class CheckpointTest(unittest.TestCase) :
+    def test_resume_matches_uninterrupted_run(self) -> None :
+        # feed a prefix , checkpoint , resume with replay() : same faults and the same state as
+        # one uninterrupted run (Optimal's heap , counters and position included)
+        reference_string=zipf_workload(4000 , pages=150 , seed=4)
+        with tempfile.TemporaryDirectory() as directory :
+            for key in ALGORITHMS :
+                for frames , prefix in ((1 , 1) , (3 , 1234) , (16 , 2500)) :
+                    checkpoint_file=os.path.join(directory , f"{key}-{frames}.json")
+                    algorithm=create_algorithm(key , frames)
+                    algorithm.prepare(reference_string)
+                    algorithm.feed_many(reference_string[:prefix])
+                    save_checkpoint(algorithm , checkpoint_file)
+                    resumed=replay(key , reference_string , frames , checkpoint_file , every=700)
+
+                    uninterrupted=create_algorithm(key , frames)
+                    uninterrupted.prepare(reference_string)
+                    uninterrupted.feed_many(reference_string)
+                    message=f"{key} with {frames} frames resumed at {prefix}"
+                    self.assertEqual(resumed.page_faults , create_algorithm(key , frames).simulate(reference_string) , message)
+                    self.assertEqual(resumed.get_state() , uninterrupted.get_state() , message)
+                    self.assertEqual(resumed.engine_counters() , uninterrupted.engine_counters() , message)
+
+class OutOfCoreTest(unittest.TestCase) :
+    def test_matches_in_memory_engines(self) -> None :
+        reference_string=phase_workload(5000 , working_set=40 , phases=5 , pages=400 , seed=5)
+        frame_counts=[1 , 4 , 32 , 128]
+        with tempfile.TemporaryDirectory() as directory :
+            text_filename=os.path.join(directory , 'trace.txt')
+            with open(text_filename , 'w') as f :
+                f.write(" ".join(map(str , reference_string)) + "\n")
+            binary_filename=os.path.join(directory , 'trace.prt')
+            write_binary_trace(reference_string , binary_filename)
+
+            for filename in (text_filename , binary_filename) :
+                result=simulate_out_of_core(filename , ['optimal' , 'lru'] , frame_counts , work_dir=directory)
+                self.assertEqual(result.references , len(reference_string))
+                for frames in frame_counts :
+                    for key in ('optimal' , 'lru') :
+                        self.assertEqual(result.page_faults[frames][key] , create_algorithm(key , frames).simulate(reference_string) ,
+                                         f"{key} with {frames} frames from {os.path.basename(filename)}")
+            # temporary traces and side files are removed
+            self.assertEqual(sorted(os.listdir(directory)) , ['trace.prt' , 'trace.txt'])
+
+if __name__ == "__main__" :
+    unittest.main()
+
+# End of code